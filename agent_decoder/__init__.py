@@ -0,0 +1,15 @@
+"""Analysis engines behind the Real Estate Agent Decoder app.
+
+The headless entry points in :mod:`agent_decoder.core` are re-exported here
+and imported on first access.
+"""
+
+__all__ = ["compute_commission", "decode_phrases", "score_red_flags", "search_glossary"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from agent_decoder import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,311 @@
+"""Asyncio JSON API over the decoder, glossary search and red flag scoring.
+
+A dependency-free ASGI application; serve it with any ASGI server::
+
+    uvicorn agent_decoder.asgi:app --workers 4
+    python -m agent_decoder.asgi --port 8000 --workers 4
+
+Endpoints (JSON in, JSON out):
+
+* ``POST /decode`` with ``{"text": ...}`` or ``{"texts": [...]}`` and an
+  optional ``"fuzzy": false``
+* ``GET /glossary/search?q=...&limit=N`` or ``POST /glossary/search`` with
+  ``{"query": ...}`` or ``{"queries": [...]}``
+* ``POST /score`` with ``{"red_flags": [...]}`` or ``{"submissions": [[...], ...]}``
+* ``GET /health``
+
+Concurrent decode and score requests are coalesced by a MicroBatcher and run
+together on one analysis thread, so the event loop keeps accepting and
+parsing requests while a batch is scored. Connections are HTTP/1.1
+keep-alive (every response carries a Content-Length).
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from urllib.parse import parse_qs
+
+from agent_decoder import core, data
+
+MAX_BODY_BYTES = 1_000_000
+
+MAX_BATCH_ITEMS = 1000
+
+# Texts up to this length have their decode results memoized.
+CACHE_TEXT_CHARS = 2000
+
+DEFAULT_SEARCH_LIMIT = 10
+
+KEEP_ALIVE_SECONDS = 30
+
+
+class APIError(Exception):
+    """A client error, reported as ``{"error": message}`` with ``status``."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MicroBatcher:
+    """Coalesce concurrent calls to ``func`` into batches run on one thread.
+
+    Items submitted while a batch is pending join it until ``max_batch``
+    items or ``max_delay`` seconds, then the batch is handed to the executor
+    in one call.
+    """
+
+    def __init__(self, func, executor, max_batch=64, max_delay=0.001):
+        self.func = func
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            loop = asyncio.get_running_loop()
+            done = loop.run_in_executor(self.executor, self._run, [item for item, _ in batch])
+            done.add_done_callback(lambda task: self._resolve(batch, task))
+
+    def _run(self, items):
+        results = []
+        for item in items:
+            try:
+                results.append((True, self.func(item)))
+            except Exception as exc:  # reported to the caller that submitted this item
+                results.append((False, exc))
+        return results
+
+    @staticmethod
+    def _resolve(batch, task):
+        if task.exception() is not None:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(task.exception())
+            return
+        for (_, future), (ok, value) in zip(batch, task.result()):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+@lru_cache(maxsize=8192)
+def _decode_cached(text, fuzzy):
+    return [asdict(decoded) for decoded in core.decode_phrases(text, fuzzy=fuzzy)]
+
+
+def decode(item):
+    """Decode one ``(text, fuzzy)`` pair into JSON-ready phrase dicts."""
+    text, fuzzy = item
+    if len(text) <= CACHE_TEXT_CHARS:
+        return _decode_cached(text, fuzzy)
+    return [asdict(decoded) for decoded in core.decode_phrases(text, fuzzy=fuzzy)]
+
+
+def score(red_flags):
+    """Score one red flag checklist into a JSON-ready dict."""
+    return asdict(core.score_red_flags(red_flags))
+
+
+def search(query, limit):
+    glossary = data.glossary()
+    return [
+        {"term": term, "score": score, **glossary[term]}
+        for term, score in core.search_glossary(query, limit)
+    ]
+
+
+def _string(value, name):
+    if not isinstance(value, str):
+        raise APIError(400, f"'{name}' must be a string")
+    return value
+
+
+def _boolean(value, name):
+    if not isinstance(value, bool):
+        raise APIError(400, f"'{name}' must be true or false")
+    return value
+
+
+def _limit(payload, query):
+    limit = payload.get("limit", DEFAULT_SEARCH_LIMIT)
+    if "limit" not in payload and "limit" in query:
+        # Query string values are always strings.
+        limit = int(query["limit"]) if query["limit"].isdigit() else None
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+        raise APIError(400, "'limit' must be a non-negative integer")
+    return limit
+
+
+def _batch(payload, name):
+    items = payload.get(name)
+    if not isinstance(items, list):
+        raise APIError(400, f"'{name}' must be a list")
+    if len(items) > MAX_BATCH_ITEMS:
+        raise APIError(413, f"at most {MAX_BATCH_ITEMS} items per request")
+    return items
+
+
+def _flag_list(value):
+    if isinstance(value, dict):
+        value = value.get("red_flags")
+    if not isinstance(value, list) or not all(isinstance(flag, str) for flag in value):
+        raise APIError(400, "red flags must be a list of strings")
+    return value
+
+
+class DecoderAPI:
+    """The ASGI application; one instance per server process."""
+
+    def __init__(self, max_batch=64, max_delay=0.001):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._decoder = None
+        self._scorer = None
+        self.routes = {
+            ("POST", "/decode"): self.decode,
+            ("GET", "/glossary/search"): self.glossary_search,
+            ("POST", "/glossary/search"): self.glossary_search,
+            ("POST", "/score"): self.score,
+            ("GET", "/health"): self.health,
+        }
+
+    def _start(self):
+        # Build every engine before the first request rather than during it.
+        core.realtor_speak_automaton()
+        core.phrase_index()
+        core.glossary_index()
+        core.risk_scorer()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
+        self._decoder = MicroBatcher(decode, executor, self.max_batch, self.max_delay)
+        self._scorer = MicroBatcher(score, executor, self.max_batch, self.max_delay)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if self._decoder is None:
+            self._start()
+        try:
+            handler = self.routes.get((scope["method"], scope["path"]))
+            if handler is None:
+                if any(path == scope["path"] for _, path in self.routes):
+                    raise APIError(405, "method not allowed")
+                raise APIError(404, "not found")
+            payload = await self._read_json(receive) if scope["method"] == "POST" else {}
+            query = {key: values[-1] for key, values in parse_qs(scope["query_string"].decode("latin-1")).items()}
+            status, body = 200, await handler(payload, query)
+        except APIError as exc:
+            status, body = exc.status, {"error": str(exc)}
+        await self._respond(send, status, body)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _read_json(receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise APIError(413, f"request body over {MAX_BODY_BYTES} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        try:
+            payload = json.loads(b"".join(chunks) or b"{}")
+        except ValueError:
+            raise APIError(400, "request body is not valid JSON")
+        if not isinstance(payload, dict):
+            raise APIError(400, "request body must be a JSON object")
+        return payload
+
+    @staticmethod
+    async def _respond(send, status, body):
+        content = json.dumps(body, separators=(",", ":")).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    async def decode(self, payload, query):
+        fuzzy = _boolean(payload.get("fuzzy", True), "fuzzy")
+        if "texts" in payload:
+            texts = [_string(text, "texts") for text in _batch(payload, "texts")]
+            phrases = await asyncio.gather(*(self._decoder.submit((text, fuzzy)) for text in texts))
+            return {"results": [{"phrases": found} for found in phrases]}
+        text = _string(payload.get("text"), "text")
+        return {"phrases": await self._decoder.submit((text, fuzzy))}
+
+    async def glossary_search(self, payload, query):
+        limit = _limit(payload, query)
+        if "queries" in payload:
+            queries = [_string(q, "queries") for q in _batch(payload, "queries")]
+            return {"results": [{"results": search(q, limit)} for q in queries]}
+        return {"results": search(_string(payload.get("query", query.get("q")), "query"), limit)}
+
+    async def score(self, payload, query):
+        if "submissions" in payload:
+            submissions = [_flag_list(item) for item in _batch(payload, "submissions")]
+            return {"results": await asyncio.gather(*(self._scorer.submit(flags) for flags in submissions))}
+        return await self._scorer.submit(_flag_list(payload.get("red_flags")))
+
+    async def health(self, payload, query):
+        return {"status": "ok", "data_version": data.version(*data.DATASETS)}
+
+
+app = DecoderAPI()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m agent_decoder.asgi", description="Serve the decoder JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="server processes")
+    args = parser.parse_args(argv)
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("Serving the API needs uvicorn: pip install uvicorn")
+    uvicorn.run(
+        "agent_decoder.asgi:app", host=args.host, port=args.port, workers=args.workers,
+        timeout_keep_alive=KEEP_ALIVE_SECONDS, access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Chunked commission audit for CSV and Parquet files of transactions.
+
+Transactions are read a chunk at a time, evaluated with the vectorized
+commission engine and checked against the calculator's above/below-average
+rate thresholds. Audited rows are appended to an output CSV as each chunk
+finishes and only running totals are kept, so memory stays flat no matter
+how large the input file is.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from agent_decoder.commission import evaluate, rate_assessment
+
+CHUNK_ROWS = 100_000
+
+# Accepted spellings for each input column, first match wins.
+COLUMN_ALIASES = {
+    "price": ("price", "sale_price", "home_price", "sold_price"),
+    "commission_rate": ("commission_rate", "commission_pct", "commission_percent", "commission", "rate"),
+    "listing_split": ("listing_split", "split"),
+    "flat_fee": ("flat_fee",),
+    "transaction_fee": ("transaction_fee", "fees", "fee", "brokerage_fee"),
+}
+
+REQUIRED_COLUMNS = ("price", "commission_rate")
+
+DEFAULTS = {"listing_split": 0.5, "flat_fee": 0.0, "transaction_fee": 0.0}
+
+# How commission rates are written: "percent" (6.0) or "fraction" (0.06).
+RATE_SCALES = ("auto", "percent", "fraction")
+
+# Rate columns named like this always hold percentages.
+PERCENT_HINTS = ("pct", "percent")
+
+# Largest rate read as a fraction: no real commission is 20% of the price,
+# while a 0.9% discount commission is.
+MAX_FRACTION_RATE = 0.2
+
+OUTPUT_COLUMNS = (
+    "row",
+    "price",
+    "commission_rate",
+    "listing_split",
+    "flat_fee",
+    "transaction_fee",
+    "total_commission",
+    "total_cost",
+    "effective_rate",
+    "assessment",
+)
+
+
+class AuditError(Exception):
+    """Raised when a transaction file cannot be audited."""
+
+
+@dataclass
+class AuditSummary:
+    rows: int = 0
+    above: int = 0
+    below: int = 0
+    invalid: int = 0
+    total_commission: float = 0.0
+    total_cost: float = 0.0
+    total_price: float = 0.0
+
+    @property
+    def flagged(self):
+        return self.above + self.below
+
+    @property
+    def average_effective_rate(self):
+        return self.total_cost / self.total_price * 100 if self.total_price else 0.0
+
+
+def resolve_columns(columns):
+    """Map canonical column names to the names used in a file's header."""
+    lookup = {str(column).strip().lower(): column for column in columns}
+    resolved = {}
+    for canonical, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lookup:
+                resolved[canonical] = lookup[alias]
+                break
+    missing = [name for name in REQUIRED_COLUMNS if name not in resolved]
+    if missing:
+        raise AuditError(f"Missing required column(s): {', '.join(missing)}")
+    return resolved
+
+
+def iter_chunks(source, name, chunksize=CHUNK_ROWS):
+    """Yield DataFrames of at most ``chunksize`` rows from a CSV or Parquet file."""
+    if str(name).lower().endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise AuditError("Parquet support requires the 'pyarrow' package.") from exc
+        try:
+            parquet = pq.ParquetFile(source)
+        except Exception as exc:
+            raise AuditError(f"Could not read Parquet file: {exc}") from exc
+        for batch in parquet.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+        return
+    try:
+        yield from pd.read_csv(source, chunksize=chunksize)
+    except (pd.errors.ParserError, UnicodeDecodeError, ValueError) as exc:
+        raise AuditError(f"Could not read CSV file: {exc}") from exc
+
+
+def detect_rate_scale(chunk, columns):
+    """Decide once per file whether commission rates are percentages or fractions.
+
+    A rate column named like ``commission_pct`` holds percentages. Otherwise
+    the rates are fractions only if every valid rate in ``chunk`` (the
+    file's first) is at most MAX_FRACTION_RATE, so a 0.9% discount
+    commission is never read as 90%.
+    """
+    name = str(columns["commission_rate"]).lower()
+    if any(hint in name for hint in PERCENT_HINTS):
+        return "percent"
+    rate = pd.to_numeric(chunk[columns["commission_rate"]], errors="coerce").to_numpy(dtype=float)
+    rate = rate[np.isfinite(rate)]
+    return "fraction" if rate.size and (rate <= MAX_FRACTION_RATE).all() else "percent"
+
+
+def audit_chunk(chunk, columns, first_row=0, rate_scale="percent"):
+    """Evaluate one chunk of transactions and return the audited rows.
+
+    ``rate_scale`` is "percent" or "fraction", as chosen for the whole file.
+    """
+    values = {}
+    for canonical in COLUMN_ALIASES:
+        if canonical in columns:
+            values[canonical] = pd.to_numeric(chunk[columns[canonical]], errors="coerce").to_numpy(dtype=float)
+        else:
+            values[canonical] = np.full(len(chunk), DEFAULTS[canonical])
+    rate = values["commission_rate"]
+    if rate_scale == "fraction":
+        rate = rate * 100
+    split = values["listing_split"]
+    split = np.where(split > 1, split / 100, split)
+    flat_fee = np.nan_to_num(values["flat_fee"])
+    transaction_fee = np.nan_to_num(values["transaction_fee"])
+    total_commission, _, _, total_cost, effective_rate = evaluate(
+        values["price"], rate, np.nan_to_num(split, nan=DEFAULTS["listing_split"]), flat_fee, transaction_fee,
+    )
+    valid = np.isfinite(values["price"]) & np.isfinite(rate)
+    assessment = np.where(valid, rate_assessment(np.nan_to_num(rate)), "invalid")
+    return pd.DataFrame({
+        "row": np.arange(first_row, first_row + len(chunk)),
+        "price": values["price"],
+        "commission_rate": rate,
+        "listing_split": split,
+        "flat_fee": flat_fee,
+        "transaction_fee": transaction_fee,
+        "total_commission": total_commission,
+        "total_cost": total_cost,
+        "effective_rate": effective_rate,
+        "assessment": assessment,
+    })
+
+
+def audit_transactions(source, out, name="transactions.csv", flagged_only=True, chunksize=CHUNK_ROWS, progress=None,
+                       rate_scale="auto"):
+    """Audit a transaction file chunk by chunk, streaming rows to ``out``.
+
+    ``out`` is a text file object that receives CSV rows; with
+    ``flagged_only`` only above-average, below-average and invalid rows are
+    written. ``progress`` is called with the running row count after every
+    chunk. ``rate_scale`` is one of RATE_SCALES; "auto" picks it with
+    :func:`detect_rate_scale`. Returns an :class:`AuditSummary`.
+    """
+    if rate_scale not in RATE_SCALES:
+        raise AuditError(f"Unknown rate scale {rate_scale!r}; expected one of {', '.join(RATE_SCALES)}")
+    summary = AuditSummary()
+    columns = None
+    header = True
+    for chunk in iter_chunks(source, name, chunksize):
+        if columns is None:
+            columns = resolve_columns(chunk.columns)
+            if rate_scale == "auto":
+                rate_scale = detect_rate_scale(chunk, columns)
+        audited = audit_chunk(chunk, columns, summary.rows, rate_scale)
+        labels = audited["assessment"]
+        valid = labels != "invalid"
+        summary.rows += len(audited)
+        summary.above += int((labels == "above").sum())
+        summary.below += int((labels == "below").sum())
+        summary.invalid += int((~valid).sum())
+        summary.total_commission += float(audited["total_commission"][valid].sum())
+        summary.total_cost += float(audited["total_cost"][valid].sum())
+        summary.total_price += float(audited["price"][valid].sum())
+        if flagged_only:
+            audited = audited[labels != "normal"]
+        audited.to_csv(out, header=header, index=False, float_format="%.4f")
+        header = False
+        if progress is not None:
+            progress(summary.rows)
+    if columns is None:
+        raise AuditError("The file contains no transactions.")
+    return summary
@@ -0,0 +1,197 @@
+"""Headless batch scoring of checklist submissions across a process pool.
+
+Reads Conflict Checker / Red Flag Checker submissions from JSONL or CSV,
+scores every red flag checklist with the same rules as the app, and streams
+the results to JSONL or CSV in input order::
+
+    python -m agent_decoder.batch submissions.jsonl -o scores.csv --workers 8
+
+JSONL records look like ``{"id": ..., "red_flags": [...], "conflicts":
+[...]}``. CSV files use ``id``, ``red_flags`` and ``conflicts`` columns with
+items separated by ``;``, or one column per red flag holding a yes/no value.
+Input is parsed, scored and serialized inside the workers in fixed-size
+chunks, and only a bounded number of chunks are in flight at once.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from agent_decoder import data
+from agent_decoder.core import risk_scorer
+
+BATCH_SIZE = 2000
+
+LIST_SEPARATOR = ";"
+
+TRUE_VALUES = {"1", "true", "yes", "y", "x", "checked", "on"}
+
+OUTPUT_FIELDS = ("id", "score", "band", "raw_points", "flags", "critical", "conflicts", "unknown_flags", "top_reasons", "error")
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+    return [str(item) for item in value]
+
+
+def parse_record(record, flag_names=()):
+    """Return (id, red_flags, conflicts) for a JSON object or CSV row dict."""
+    flags = _as_list(record.get("red_flags"))
+    for name in flag_names:
+        if str(record.get(name, "")).strip().lower() in TRUE_VALUES:
+            flags.append(name)
+    return record.get("id"), flags, _as_list(record.get("conflicts"))
+
+
+def score_record(record, flag_names=()):
+    """Score one submission into an output row keyed by OUTPUT_FIELDS."""
+    submission_id, flags, conflicts = parse_record(record, flag_names)
+    assessment = risk_scorer().score(flags)
+    return {
+        "id": submission_id,
+        "score": assessment.score,
+        "band": assessment.band,
+        "raw_points": assessment.raw_points,
+        "flags": len(assessment.flags),
+        "critical": assessment.critical,
+        "conflicts": len(set(conflicts)),
+        "unknown_flags": LIST_SEPARATOR.join(assessment.unknown),
+        "top_reasons": LIST_SEPARATOR.join(c.label for c in assessment.contributions[:3]),
+        "error": "",
+    }
+
+
+def _error_row(message, submission_id=None):
+    row = dict.fromkeys(OUTPUT_FIELDS, "")
+    row.update(id=submission_id, error=message)
+    return row
+
+
+def _score_or_error(record, flag_names=()):
+    # A malformed field fails only its own row, not the whole chunk.
+    try:
+        return score_record(record, flag_names)
+    except (TypeError, ValueError, AttributeError) as exc:
+        return _error_row(f"invalid record: {exc}", record.get("id"))
+
+
+def score_chunk(kind, items, header, output_format):
+    """Parse, score and serialize one chunk; runs inside a worker."""
+    rows = []
+    if kind == "jsonl":
+        for line in items:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                rows.append(_error_row(f"invalid JSON: {exc.msg}"))
+                continue
+            if not isinstance(record, dict):
+                rows.append(_error_row("record is not an object"))
+                continue
+            rows.append(_score_or_error(record))
+    else:
+        flag_names = [name for name in header if name in data.red_flags()]
+        for values in items:
+            rows.append(_score_or_error(dict(zip(header, values)), flag_names))
+
+    out = io.StringIO()
+    if output_format == "csv":
+        csv.DictWriter(out, OUTPUT_FIELDS, lineterminator="\n").writerows(rows)
+    else:
+        for row in rows:
+            out.write(json.dumps(row) + "\n")
+    return out.getvalue()
+
+
+def iter_chunks(stream, kind, batch_size=BATCH_SIZE):
+    """Yield (header, items) chunks of raw JSONL lines or parsed CSV rows."""
+    if kind == "csv":
+        reader = csv.reader(stream)
+        header = [name.strip() for name in next(reader, [])]
+        source = reader
+    else:
+        header = None
+        source = (line for line in stream if line.strip())
+    chunk = []
+    for item in source:
+        chunk.append(item)
+        if len(chunk) >= batch_size:
+            yield header, chunk
+            chunk = []
+    if chunk:
+        yield header, chunk
+
+
+def run(stream, out, kind="jsonl", output_format="jsonl", workers=None, batch_size=BATCH_SIZE):
+    """Score every submission in ``stream`` and write results to ``out``.
+
+    ``workers=0`` scores in the current process; otherwise chunks are
+    spread over a ProcessPoolExecutor with at most two chunks per worker in
+    flight. Results are written in input order as chunks complete.
+    Returns the number of submissions scored.
+    """
+    if output_format == "csv":
+        csv.writer(out, lineterminator="\n").writerow(OUTPUT_FIELDS)
+    count = 0
+    chunks = iter_chunks(stream, kind, batch_size)
+    if workers == 0:
+        for header, items in chunks:
+            out.write(score_chunk(kind, items, header, output_format))
+            count += len(items)
+        return count
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=risk_scorer) as pool:
+        pending = deque()
+        for header, items in chunks:
+            pending.append((pool.submit(score_chunk, kind, items, header, output_format), len(items)))
+            if len(pending) >= workers * 2:
+                future, size = pending.popleft()
+                out.write(future.result())
+                count += size
+        while pending:
+            future, size = pending.popleft()
+            out.write(future.result())
+            count += size
+    return count
+
+
+def _format_for(path, default):
+    if path and path.lower().endswith(".csv"):
+        return "csv"
+    if path and path.lower().endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return default
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m agent_decoder.batch", description="Score checklist submissions in bulk.")
+    parser.add_argument("input", help="JSONL or CSV file of submissions ('-' for JSONL on stdin)")
+    parser.add_argument("-o", "--output", help="output .jsonl or .csv file (default: JSONL on stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count, 0 = no pool)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="submissions per chunk")
+    args = parser.parse_args(argv)
+
+    kind = _format_for(args.input, "jsonl")
+    output_format = _format_for(args.output, "jsonl")
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    out = sys.stdout if not args.output else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        count = run(source, out, kind, output_format, args.workers, args.batch_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"Scored {count} submissions", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Content-addressed on-disk cache for document analysis results.
+
+Entries live in one SQLite file, keyed by a SHA-256 of the uploaded bytes
+and tagged with the version of the data they were computed against. Opening
+the cache with a different version drops every stale entry, and once the
+stored payloads exceed ``max_bytes`` the least recently used entries are
+evicted. Payloads are zlib-compressed JSON.
+
+Every operation opens its own short-lived connection, so one AnalysisCache
+can be shared by all Streamlit sessions and threads of a process.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from dataclasses import asdict
+from pathlib import Path
+
+from agent_decoder.documents import DocumentReport, Finding, upload_buffer
+from agent_decoder.fees import Amount
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("AGENT_DECODER_CACHE_DIR", Path.home() / ".cache" / "agent_decoder"))
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+"""
+
+
+def content_key(file, name=""):
+    """SHA-256 of a file-like object's bytes plus its extension; rewinds the file."""
+    file.seek(0)
+    with upload_buffer(file) as view:
+        digest = hashlib.sha256(view).hexdigest()
+    file.seek(0)
+    return f"{digest}{Path(name).suffix.lower()}"
+
+
+def encode_report(report):
+    return zlib.compress(json.dumps(asdict(report), separators=(",", ":")).encode(), 1)
+
+
+def decode_report(payload):
+    fields = json.loads(zlib.decompress(payload))
+    fields["findings"] = [Finding(**finding) for finding in fields["findings"]]
+    fields["amounts"] = [Amount(**amount) for amount in fields.get("amounts", ())]
+    return DocumentReport(**fields)
+
+
+class AnalysisCache:
+    """SQLite-backed LRU cache of DocumentReports for one data version."""
+
+    def __init__(self, path, version, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.version = version
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            conn.execute("DELETE FROM entries WHERE version != ?", (version,))
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return _Transaction(conn)
+
+    def get(self, key):
+        """Return the cached DocumentReport for ``key``, or None."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT payload FROM entries WHERE key = ? AND version = ?", (key, self.version)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return decode_report(row[0])
+
+    def put(self, key, report):
+        payload = encode_report(report)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, version, size, last_used, payload) VALUES (?, ?, ?, ?, ?)",
+                (key, self.version, len(payload), time.time(), payload),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        excess = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def stats(self):
+        """(entries, stored bytes) currently in the cache."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+
+class _Transaction:
+    """Commit (or roll back) and close a connection on exit."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        with closing(self.conn):
+            if exc_type is None:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
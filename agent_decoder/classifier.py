@@ -0,0 +1,200 @@
+"""Hashed n-gram linear classifier for pressure tactics.
+
+Sentences are normalized like the fuzzy index (contractions expanded,
+text-speak spelled out) and turned into word unigrams, word bigrams and
+character trigrams. Every feature is hashed with CRC-32 into a fixed number
+of signed buckets, so there is no vocabulary to store, and a multinomial
+logistic regression over the buckets picks a tactic or NONE_LABEL.
+
+The model is trained offline from the psychology examples, paraphrases,
+triggers and linked realtor-speak (one class per tactic), with
+counter-phrases, unlinked realtor-speak and glossary text as NONE_LABEL::
+
+    python -m agent_decoder.classifier
+
+and shipped as ``data/tactic_model.npy`` (float32 weights, memory-mapped at
+load) plus ``data/tactic_model.json`` (labels and settings).
+"""
+import json
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from agent_decoder.fuzzy import _PARENTHETICAL, ngrams, normalize
+
+MODEL_PATH = Path(__file__).with_name("data") / "tactic_model"
+
+BUCKETS = 1 << 14
+
+NONE_LABEL = "None"
+
+# Lowest probability at which a tactic prediction is reported.
+CONFIDENCE_THRESHOLD = 0.4
+
+_SIGN_BIT = 1 << 31
+
+
+@dataclass(frozen=True)
+class Prediction:
+    label: str
+    confidence: float
+
+    @property
+    def is_tactic(self):
+        """True for a tactic label at or above CONFIDENCE_THRESHOLD."""
+        return self.label != NONE_LABEL and self.confidence >= CONFIDENCE_THRESHOLD
+
+
+@lru_cache(maxsize=65536)
+def _hash(feature):
+    value = zlib.crc32(feature.encode())
+    return value % BUCKETS, -1.0 if value & _SIGN_BIT else 1.0
+
+
+def features(text):
+    """Return (bucket indices, signed values) for one sentence.
+
+    Values are scaled so every sentence has unit length, whatever its size.
+    """
+    normalized = normalize(_PARENTHETICAL.sub("", text))
+    words = normalized.split()
+    names = {f"w:{word}" for word in words}
+    names.update(f"b:{a} {b}" for a, b in zip(words, words[1:]))
+    names.update(f"c:{gram}" for gram in ngrams(normalized) if gram.strip())
+    if not words:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    hashed = [_hash(name) for name in names]
+    indices = np.fromiter((index for index, _ in hashed), dtype=np.int64, count=len(hashed))
+    values = np.fromiter((sign for _, sign in hashed), dtype=np.float32, count=len(hashed))
+    return indices, values / np.float32(np.sqrt(len(hashed)))
+
+
+def _softmax(scores):
+    scores = scores - scores.max(axis=-1, keepdims=True)
+    exp = np.exp(scores)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+class TacticClassifier:
+    """A trained weight matrix (BUCKETS + 1 bias row, one column per label)."""
+
+    def __init__(self, weights, labels, data_version=""):
+        self.weights = weights
+        self.labels = tuple(labels)
+        self.data_version = data_version
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        """Memory-map a saved model; pages stay on disk until first touched."""
+        path = Path(path)
+        meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        if meta["buckets"] != BUCKETS:
+            raise ValueError(f"model was trained with {meta['buckets']} buckets, expected {BUCKETS}")
+        weights = np.load(path.with_suffix(".npy"), mmap_mode="r")
+        return cls(weights, meta["labels"], meta.get("data_version", ""))
+
+    def save(self, path=MODEL_PATH):
+        path = Path(path)
+        np.save(path.with_suffix(".npy"), np.ascontiguousarray(self.weights, dtype=np.float32))
+        meta = {"buckets": BUCKETS, "labels": list(self.labels), "data_version": self.data_version}
+        path.with_suffix(".json").write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+
+    def _scores(self, indices, values):
+        return values @ self.weights[indices] + self.weights[BUCKETS]
+
+    def predict_proba(self, text):
+        """Probability of every label for one sentence, as a dict."""
+        return dict(zip(self.labels, _softmax(self._scores(*features(text))).tolist()))
+
+    def predict(self, text):
+        probabilities = _softmax(self._scores(*features(text)))
+        best = int(probabilities.argmax())
+        return Prediction(self.labels[best], round(float(probabilities[best]), 3))
+
+    def predict_many(self, texts):
+        """Classify a batch of sentences with one gather over the weights."""
+        texts = list(texts)
+        if not texts:
+            return []
+        hashed = [features(text) for text in texts]
+        lengths = np.array([len(indices) for indices, _ in hashed])
+        indices = np.concatenate([indices for indices, _ in hashed])
+        values = np.concatenate([values for _, values in hashed])
+        weighted = self.weights[indices] * values[:, None]
+        scores = np.zeros((len(texts), len(self.labels)), dtype=np.float32)
+        nonempty = lengths > 0
+        if nonempty.any():
+            offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])[nonempty]
+            scores[nonempty] = np.add.reduceat(weighted, offsets, axis=0)
+        probabilities = _softmax(scores + self.weights[BUCKETS])
+        best = probabilities.argmax(axis=1)
+        return [
+            Prediction(self.labels[label], round(float(probabilities[row, label]), 3))
+            for row, label in enumerate(best)
+        ]
+
+
+def training_set(psychology, realtor_speak, glossary):
+    """Labelled (text, label) pairs drawn from the reference data."""
+    pairs = []
+    linked = set()
+    for tactic, details in psychology.items():
+        for field in ("examples", "paraphrases", "triggers", "realtor_speak"):
+            pairs.extend((text, tactic) for text in details.get(field, ()))
+        linked.update(details.get("realtor_speak", ()))
+        for text in details.get("counter_phrases", ()):
+            pairs.append((text, NONE_LABEL))
+    for phrase in realtor_speak:
+        if phrase not in linked:
+            pairs.append((phrase, NONE_LABEL))
+    for term, details in glossary.items():
+        pairs.append((term, NONE_LABEL))
+        pairs.extend((details[field], NONE_LABEL) for field in ("definition", "consumer_impact", "what_to_ask"))
+    return pairs
+
+
+def train(pairs, epochs=400, learning_rate=2.0, l2=1e-4, data_version=""):
+    """Fit the weights by full-batch gradient descent with balanced class weights."""
+    labels = sorted({label for _, label in pairs}, key=lambda label: (label == NONE_LABEL, label))
+    column = {label: i for i, label in enumerate(labels)}
+    x = np.zeros((len(pairs), BUCKETS + 1), dtype=np.float32)
+    for row, (text, _) in enumerate(pairs):
+        indices, values = features(text)
+        np.add.at(x[row], indices, values)
+    x[:, BUCKETS] = 1.0
+    y = np.zeros((len(pairs), len(labels)), dtype=np.float32)
+    y[np.arange(len(pairs)), [column[label] for _, label in pairs]] = 1.0
+    sample_weight = (len(pairs) / (len(labels) * y.sum(axis=0)))[y.argmax(axis=1)][:, None]
+
+    weights = np.zeros((BUCKETS + 1, len(labels)), dtype=np.float32)
+    for _ in range(epochs):
+        gradient = x.T @ ((_softmax(x @ weights) - y) * sample_weight) / len(pairs)
+        weights -= learning_rate * (gradient + l2 * weights)
+    return TacticClassifier(weights, labels, data_version)
+
+
+def main():
+    import time
+
+    from agent_decoder import data
+
+    pairs = training_set(data.psychology(), data.realtor_speak(), data.glossary())
+    model = train(pairs, data_version=data.version("psychology", "realtor_speak", "glossary"))
+    model.save()
+    model = TacticClassifier.load()
+
+    correct = sum(p.label == label for p, (_, label) in zip(model.predict_many(t for t, _ in pairs), pairs))
+    start = time.perf_counter()
+    for text, _ in pairs:
+        model.predict(text)
+    per_sentence = (time.perf_counter() - start) / len(pairs) * 1000
+    size = MODEL_PATH.with_suffix(".npy").stat().st_size
+    print(f"Trained on {len(pairs)} sentences, {len(model.labels)} labels; training accuracy {correct / len(pairs):.0%}")
+    print(f"Wrote {MODEL_PATH.with_suffix('.npy')} ({size / 1024:.0f} KB); {per_sentence:.3f} ms per sentence")
+
+
+if __name__ == "__main__":
+    main()
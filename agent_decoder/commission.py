@@ -0,0 +1,81 @@
+"""Vectorized commission and agent-fee scenario engine.
+
+A scenario is one combination of sale price, total commission rate, listing
+agent split, flat fee and brokerage transaction fee. Whole grids of scenarios
+are evaluated with NumPy broadcasting in a single pass instead of a Python
+loop per combination. pandas is only imported by the grid builders, so a
+single-sale calculation stays cheap to import.
+"""
+import numpy as np
+
+# Rates (in percent) the calculator treats as above or below the usual range.
+ABOVE_AVERAGE_RATE = 6.5
+BELOW_AVERAGE_RATE = 5.0
+
+SCENARIO_COLUMNS = (
+    "price",
+    "rate",
+    "listing_split",
+    "flat_fee",
+    "transaction_fee",
+    "total_commission",
+    "listing_agent",
+    "buying_agent",
+    "total_cost",
+    "effective_rate",
+)
+
+
+def rate_assessment(rate):
+    """Classify commission rates as "above", "below" or "normal".
+
+    Accepts a scalar or an array; arrays are classified element-wise.
+    """
+    rate = np.asarray(rate, dtype=float)
+    labels = np.select([rate > ABOVE_AVERAGE_RATE, rate < BELOW_AVERAGE_RATE], ["above", "below"], "normal")
+    return labels.item() if labels.ndim == 0 else labels
+
+
+def evaluate(price, rate, split, flat_fee, transaction_fee):
+    """Evaluate broadcastable arrays of scenario inputs.
+
+    Returns (total_commission, listing_agent, buying_agent, total_cost,
+    effective_rate) arrays.
+    """
+    percentage = price * (rate / 100)
+    listing = percentage * split + flat_fee
+    buying = percentage * (1 - split)
+    total_commission = listing + buying
+    total_cost = total_commission + transaction_fee
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effective_rate = np.where(price > 0, total_cost / price * 100, 0.0)
+    return total_commission, listing, buying, total_cost, effective_rate
+
+
+def scenario_grid(prices, rates, splits=(0.5,), flat_fees=(0.0,), transaction_fees=(0.0,)):
+    """Evaluate every combination of the given inputs in one vectorized pass.
+
+    ``rates`` are percentages, ``splits`` the listing agent's share of the
+    percentage commission (0-1), and flat fees are paid to the listing side.
+    Returns a DataFrame with one row per scenario and SCENARIO_COLUMNS.
+    """
+    import pandas as pd
+
+    axes = [np.asarray(values, dtype=float).ravel() for values in (prices, rates, splits, flat_fees, transaction_fees)]
+    mesh = np.meshgrid(*axes, indexing="ij", sparse=True)
+    outputs = np.broadcast_arrays(*mesh, *evaluate(*mesh))
+    return pd.DataFrame({column: values.ravel() for column, values in zip(SCENARIO_COLUMNS, outputs)})
+
+
+def scenario_matrix(prices, rates, split=0.5, flat_fee=0.0, transaction_fee=0.0, value="total_cost"):
+    """Return one output over a price x rate grid as a 2-D DataFrame.
+
+    Rows are indexed by price and columns by rate, ready for a heatmap.
+    """
+    import pandas as pd
+
+    prices = np.asarray(prices, dtype=float).ravel()
+    rates = np.asarray(rates, dtype=float).ravel()
+    outputs = dict(zip(SCENARIO_COLUMNS[5:], evaluate(prices[:, None], rates[None, :], split, flat_fee, transaction_fee)))
+    matrix = np.broadcast_to(outputs[value], (prices.size, rates.size))
+    return pd.DataFrame(matrix, index=pd.Index(prices, name="price"), columns=pd.Index(rates, name="rate"))
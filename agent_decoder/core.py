@@ -0,0 +1,256 @@
+"""Headless entry points for the analysis engines behind every tool.
+
+Nothing here imports Streamlit, so batch jobs and API workers can use the
+same logic as the app without paying for its startup. Each compiled engine
+is built on first use and shared for the life of the process; NumPy is only
+imported when a commission is computed or the tactic classifier is loaded.
+"""
+import re
+import sqlite3
+from dataclasses import dataclass
+from functools import lru_cache
+
+from agent_decoder import data
+from agent_decoder.documents import ANALYZER_VERSION, analyze_document, build_pattern_set, iter_segments
+from agent_decoder.fuzzy import build_phrase_index
+from agent_decoder.matching import PhraseAutomaton
+from agent_decoder.revisions import compare_texts
+from agent_decoder.scoring import RiskScorer
+from agent_decoder.search import GlossaryIndex
+from agent_decoder.transcript import TranscriptAnalyzer, build_transcript_patterns
+
+SIMILARITY_THRESHOLD = 0.7
+
+# Datasets the document patterns are compiled from.
+DOCUMENT_DATASETS = ("red_flags", "glossary", "realtor_speak")
+
+# Revision diffs kept in memory, by the content keys of the two uploads.
+REVISION_CACHE_SIZE = 8
+
+_SENTENCE = re.compile(r"[^.!?\n]+[.!?]*")
+
+_revision_diffs = {}
+
+
+@dataclass(frozen=True)
+class DecodedPhrase:
+    """A known phrase, or a close paraphrase of one, found in some text.
+
+    ``source`` is "realtor_speak" or "psychology". For realtor-speak,
+    ``phrase`` is the known phrase and ``meaning`` its translation; for
+    psychology, ``phrase`` is the tactic and ``meaning`` the example that
+    was matched. Exact matches have ``exact`` set and a score of 1.0.
+    """
+    source: str
+    phrase: str
+    meaning: str
+    start: int
+    end: int
+    score: float
+    exact: bool
+
+
+@dataclass(frozen=True)
+class CommissionBreakdown:
+    price: float
+    rate: float
+    total_commission: float
+    listing_agent: float
+    buying_agent: float
+    total_cost: float
+    effective_rate: float
+    assessment: str
+
+
+@lru_cache(maxsize=None)
+def realtor_speak_automaton():
+    """Exact-match automaton over the realtor-speak phrase table."""
+    return PhraseAutomaton(data.realtor_speak())
+
+
+@lru_cache(maxsize=None)
+def phrase_index():
+    """Fuzzy index over realtor-speak phrases and tactic examples."""
+    return build_phrase_index(data.realtor_speak(), data.psychology())
+
+
+@lru_cache(maxsize=None)
+def glossary_index():
+    """Ranked search index over the glossary."""
+    return GlossaryIndex(data.glossary())
+
+
+@lru_cache(maxsize=None)
+def document_patterns():
+    """Document scanning patterns for red flags, glossary terms and realtor-speak."""
+    return build_pattern_set(data.red_flags(), data.glossary(), data.realtor_speak())
+
+
+@lru_cache(maxsize=None)
+def document_cache():
+    """The on-disk document analysis cache, or None if it cannot be opened."""
+    from agent_decoder.cache import DEFAULT_CACHE_DIR, AnalysisCache
+
+    version = f"{data.version(*DOCUMENT_DATASETS)}-analyzer.{ANALYZER_VERSION}"
+    try:
+        return AnalysisCache(DEFAULT_CACHE_DIR / "documents.sqlite3", version)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+@lru_cache(maxsize=None)
+def transcript_patterns():
+    """Tactic triggers and realtor-speak phrases for transcript tagging."""
+    return build_transcript_patterns(data.psychology(), data.realtor_speak())
+
+
+@lru_cache(maxsize=None)
+def tactic_classifier():
+    """The shipped tactic classifier, memory-mapped on first use."""
+    from agent_decoder.classifier import TacticClassifier
+
+    return TacticClassifier.load()
+
+
+@lru_cache(maxsize=None)
+def fee_extractor():
+    """Amount and fee-label patterns, compiled against the glossary."""
+    from agent_decoder.fees import FeeExtractor
+
+    return FeeExtractor(data.glossary())
+
+
+@lru_cache(maxsize=None)
+def risk_scorer():
+    """Red flag scorer compiled against the current risk rules."""
+    return RiskScorer(data.red_flags(), data.risk_rules())
+
+
+def decode_phrases(text, fuzzy=True, threshold=SIMILARITY_THRESHOLD):
+    """Find realtor-speak and tactic phrases in ``text``.
+
+    Exact matches come first in text order, followed by fuzzy matches of
+    phrases that did not match exactly (when ``fuzzy`` is set).
+    """
+    exact = [
+        DecodedPhrase("realtor_speak", m.phrase, m.value, m.start, m.end, 1.0, True)
+        for m in realtor_speak_automaton().find_all(text)
+    ]
+    if not fuzzy:
+        return exact
+    seen = {decoded.phrase for decoded in exact}
+    similar = [
+        DecodedPhrase(m.value[0], m.value[1], m.value[2], m.start, m.end, m.score, False)
+        for m in phrase_index().search(text, threshold)
+        if m.phrase not in seen
+    ]
+    return exact + similar
+
+
+def transcript_analyzer(fuzzy=True):
+    """A fresh TranscriptAnalyzer sharing the process-wide compiled patterns."""
+    return TranscriptAnalyzer(
+        transcript_patterns(), data.psychology(), phrase_index() if fuzzy else None, tactic_classifier(),
+    )
+
+
+def classify_tactics(text):
+    """Split ``text`` into sentences and return (sentence, Prediction) pairs for likely tactics."""
+    sentences = [match.group().strip() for match in _SENTENCE.finditer(text) if match.group().strip()]
+    predictions = tactic_classifier().predict_many(sentences)
+    return [(sentence, prediction) for sentence, prediction in zip(sentences, predictions) if prediction.is_tactic]
+
+
+def analyze_upload(file, name=None, use_cache=True, progress=None):
+    """Analyze an uploaded document, reusing the stored result for identical bytes.
+
+    Returns ``(report, cached)``; the report keeps the extracted text and
+    every amount found. The cache is skipped silently when it is
+    unavailable. PDF pages are spread over a process pool, with
+    ``progress(done, total)`` called as they complete.
+    """
+    from agent_decoder.cache import content_key
+
+    name = name or getattr(file, "name", "") or ""
+    cache = document_cache() if use_cache else None
+    key = content_key(file, name) if cache is not None else None
+    if cache is not None:
+        try:
+            report = cache.get(key)
+        except sqlite3.Error:
+            report = None
+        if report is not None:
+            return report, True
+    if name.lower().endswith(".pdf"):
+        from agent_decoder.parallel import analyze_pdf
+
+        report = analyze_pdf(file, keep_text=True, amounts=True, progress=progress)
+    else:
+        report = analyze_document(file, document_patterns(), name, keep_text=True, fees=fee_extractor())
+    if cache is not None:
+        try:
+            cache.put(key, report)
+        except sqlite3.Error:
+            pass
+    return report, False
+
+
+def extract_text(file, name=None):
+    """Segment texts of an upload, from the document cache when it holds the same bytes."""
+    from agent_decoder.cache import content_key
+
+    name = name or getattr(file, "name", "") or ""
+    cache = document_cache()
+    if cache is not None:
+        try:
+            report = cache.get(content_key(file, name))
+        except sqlite3.Error:
+            report = None
+        if report is not None and report.texts:
+            return report.texts
+    return [segment.text[segment.overlap:] for segment in iter_segments(file, name)]
+
+
+def compare_uploads(old_file, new_file):
+    """Diff two revisions of a document clause by clause; returns a RevisionDiff.
+
+    The last REVISION_CACHE_SIZE diffs are kept by the content keys of the
+    two uploads, so page reruns with the same files do not diff them again.
+    """
+    from agent_decoder.cache import content_key
+
+    key = (content_key(old_file, getattr(old_file, "name", "") or ""), content_key(new_file, getattr(new_file, "name", "") or ""))
+    diff = _revision_diffs.pop(key, None)
+    if diff is None:
+        diff = compare_texts(extract_text(old_file), extract_text(new_file), document_patterns())
+    _revision_diffs[key] = diff
+    for stale in list(_revision_diffs)[:-REVISION_CACHE_SIZE]:
+        _revision_diffs.pop(stale, None)
+    return diff
+
+
+def extract_amounts(texts):
+    """Every currency amount and percentage in a document's segment texts, with its fee label."""
+    return fee_extractor().scan(texts)
+
+
+def search_glossary(query, limit=None):
+    """Rank glossary terms against ``query``; returns (term, score) pairs."""
+    return glossary_index().search(query, limit)
+
+
+def score_red_flags(selected):
+    """Score a red flag checklist; returns a RiskAssessment."""
+    return risk_scorer().score(selected)
+
+
+def compute_commission(price, rate, split=0.5, flat_fee=0.0, transaction_fee=0.0):
+    """Break down one sale's commission.
+
+    ``rate`` is a percentage and ``split`` the listing agent's share of the
+    percentage commission (0-1).
+    """
+    from agent_decoder.commission import evaluate, rate_assessment
+
+    outputs = evaluate(float(price), float(rate), split, flat_fee, transaction_fee)
+    return CommissionBreakdown(float(price), float(rate), *(float(value) for value in outputs), rate_assessment(rate))
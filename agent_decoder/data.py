@@ -0,0 +1,104 @@
+"""Versioned knowledge datasets, parsed once per process and read-only.
+
+Each dataset lives in ``agent_decoder/data/<name>.json`` as
+``{"version": ..., "entries": {...}}``. Nothing is read until a dataset is
+first requested, and every later request in the same process gets the same
+frozen object back.
+"""
+import json
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+DATA_DIR = Path(__file__).parent / "data"
+
+DATASETS = ("glossary", "red_flags", "psychology", "realtor_speak", "risk_rules")
+
+# Fields each dataset is partitioned on as it loads.
+INDEXED_FIELDS = {
+    "glossary": ("category", "red_flag_level", "negotiable"),
+    "red_flags": ("category", "severity"),
+}
+
+
+class Dataset(Mapping):
+    """Read-only view over one dataset's entries, keyed by entry name."""
+
+    def __init__(self, name, version, entries, indexed_fields=()):
+        self.name = name
+        self.version = version
+        self._entries = entries
+        self._partitions = {field: _partition(entries, field) for field in indexed_fields}
+
+    def __getitem__(self, key):
+        return self._entries[key]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<Dataset {self.name} v{self.version}: {len(self)} entries>"
+
+    def by(self, field):
+        """Entries grouped by ``field`` as ``{value: {name: entry}}``.
+
+        Groups keep the dataset's order and are built once; fields not listed
+        in INDEXED_FIELDS are partitioned on first request.
+        """
+        if field not in self._partitions:
+            self._partitions[field] = _partition(self._entries, field)
+        return self._partitions[field]
+
+
+def _partition(entries, field):
+    groups = {}
+    for key, entry in entries.items():
+        groups.setdefault(entry[field], {})[key] = entry
+    return MappingProxyType({value: MappingProxyType(group) for value, group in groups.items()})
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def load(name):
+    """Parse a dataset file the first time it is requested."""
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name}")
+    with open(DATA_DIR / f"{name}.json", encoding="utf-8") as f:
+        raw = json.load(f)
+    return Dataset(name, raw["version"], _freeze(raw["entries"]), INDEXED_FIELDS.get(name, ()))
+
+
+def glossary():
+    return load("glossary")
+
+
+def red_flags():
+    return load("red_flags")
+
+
+def psychology():
+    return load("psychology")
+
+
+def realtor_speak():
+    return load("realtor_speak")
+
+
+def risk_rules():
+    return load("risk_rules")
+
+
+def version(*names):
+    """Combined version tag for the named datasets (all of them by default)."""
+    return "-".join(f"{name}.{load(name).version}" for name in names or DATASETS)
@@ -0,0 +1,373 @@
+"""Streaming text extraction and pattern analysis for uploaded documents.
+
+Documents are read one page (PDF) or paragraph (TXT, DOCX) at a time and every
+segment is scanned once by a phrase automaton holding all red-flag triggers,
+glossary terms and realtor-speak phrases, so memory stays bounded by the
+largest segment rather than the whole document.
+
+The upload's bytes are never copied whole: in-memory uploads are viewed in
+place, files on disk are memory-mapped, and other streams are spilled to a
+temporary file and mapped. Plain text is decoded from that view a chunk at a
+time, and runs too long to be one segment are cut into windows that overlap
+by OVERLAP_CHARS so no phrase is lost at a cut.
+"""
+import codecs
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+
+from agent_decoder.matching import PhraseAutomaton, normalize
+
+# Longest paragraph we buffer from a plain-text upload before flushing it.
+MAX_SEGMENT_CHARS = 64_000
+
+# Characters repeated at the start of a window cut from a longer run: well
+# over the longest phrase (37 characters), to allow for runs of whitespace.
+OVERLAP_CHARS = 256
+
+# Bytes decoded at a time from a plain-text upload.
+READ_CHUNK_BYTES = 1024 * 1024
+
+# Streams that are neither in memory nor on disk are spilled to a temporary
+# file once they are larger than this.
+SPILL_BYTES = 8 * 1024 * 1024
+
+# Extracted text is only kept for documents up to this size.
+MAX_KEPT_CHARS = 4_000_000
+
+# Characters of surrounding text kept with each finding.
+CONTEXT_CHARS = 60
+
+SEVERITY_ORDER = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}
+
+# Realtor-speak entries carry no severity of their own.
+REALTOR_SPEAK_SEVERITY = "Medium"
+
+# Bump when extraction or scanning changes, so cached reports are recomputed.
+ANALYZER_VERSION = 6
+
+
+class DocumentError(Exception):
+    """Raised when an uploaded document cannot be read."""
+
+
+@dataclass
+class Segment:
+    number: int
+    text: str
+    # Leading characters repeated from the previous segment.
+    overlap: int = 0
+    # Where the segment starts in the document's text, when the reader knows;
+    # otherwise segments are placed end to end with one separator between.
+    start: int = None
+
+
+@dataclass
+class Finding:
+    source: str
+    key: str
+    severity: str
+    matched: str
+    segment: int
+    offset: int
+    context: str
+
+
+@dataclass
+class DocumentReport:
+    unit: str
+    segments: int = 0
+    characters: int = 0
+    findings: list = field(default_factory=list)
+    texts: list = field(default_factory=list)
+    amounts: list = field(default_factory=list)
+
+    def by_source(self, source):
+        return [f for f in self.findings if f.source == source]
+
+    def severity_counts(self):
+        counts = dict.fromkeys(SEVERITY_ORDER, 0)
+        for finding in self.findings:
+            counts[finding.severity] = counts.get(finding.severity, 0) + 1
+        return counts
+
+
+def glossary_aliases(term):
+    """Return the phrases a glossary term is written as in documents.
+
+    "PMI (Private Mortgage Insurance)" is found as either "PMI" or
+    "Private Mortgage Insurance".
+    """
+    match = re.fullmatch(r"(.+?)\s*\((.+)\)", term)
+    names = [match.group(1), match.group(2)] if match else [term]
+    aliases = []
+    for name in names:
+        aliases.append(name)
+        if "'" in name:
+            aliases.append(name.replace("'", ""))
+    return aliases
+
+
+def build_pattern_set(red_flags, glossary, realtor_speak):
+    """Compile every searchable phrase into a single phrase automaton.
+
+    Each phrase maps to one or more (source, key, severity) targets, so a
+    document is scanned once no matter how many entries share a phrase.
+    """
+    targets = {}
+
+    def add(phrase, target):
+        targets.setdefault(normalize(phrase), []).append(target)
+
+    for flag, details in red_flags.items():
+        for phrase in details.get("document_triggers", ()):
+            add(phrase, ("red_flag", flag, details["severity"]))
+    for term, details in glossary.items():
+        for alias in glossary_aliases(term):
+            add(alias, ("glossary", term, details["red_flag_level"]))
+    for phrase in realtor_speak:
+        add(phrase, ("realtor_speak", phrase, REALTOR_SPEAK_SEVERITY))
+    return PhraseAutomaton(targets)
+
+
+def iter_segments(file, name=None):
+    """Yield the text of an uploaded file one page or paragraph at a time."""
+    name = (name or getattr(file, "name", "") or "").lower()
+    if name.endswith(".pdf"):
+        return _iter_pdf_pages(file)
+    if name.endswith(".docx"):
+        return _iter_docx_paragraphs(file)
+    return _iter_text_paragraphs(file)
+
+
+def document_unit(name):
+    return "page" if name.lower().endswith(".pdf") else "paragraph"
+
+
+@contextmanager
+def upload_buffer(file):
+    """Yield a read-only memoryview of all of an upload's bytes.
+
+    BytesIO-like uploads (Streamlit's UploadedFile is one) are viewed in
+    place and real files are memory-mapped. Any other stream is read into
+    memory when small and spilled to a temporary file and mapped otherwise.
+    """
+    if hasattr(file, "getbuffer"):
+        with file.getbuffer() as view, view.toreadonly() as readonly:
+            yield readonly
+        return
+    try:
+        fileno = file.fileno()
+    except (AttributeError, OSError, ValueError):
+        fileno = None
+    if fileno is not None:
+        with _mapped(fileno) as view:
+            yield view
+        return
+    head = file.read(SPILL_BYTES)
+    if len(head) < SPILL_BYTES:
+        yield memoryview(head)
+        return
+    with tempfile.TemporaryFile() as spill:
+        spill.write(head)
+        del head
+        shutil.copyfileobj(file, spill, READ_CHUNK_BYTES)
+        spill.flush()
+        with _mapped(spill.fileno()) as view:
+            yield view
+
+
+@contextmanager
+def _mapped(fileno):
+    if os.fstat(fileno).st_size == 0:
+        # mmap refuses empty files.
+        yield memoryview(b"")
+        return
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+        yield view
+
+
+def _decoded_chunks(view):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for start in range(0, len(view), READ_CHUNK_BYTES):
+        yield decoder.decode(view[start:start + READ_CHUNK_BYTES])
+    yield decoder.decode(b"", final=True)
+
+
+_PARAGRAPH_BREAK = re.compile(r"\n(?:[^\S\n]*\n)+")
+
+
+def _iter_text_paragraphs(file):
+    with upload_buffer(file) as view:
+        number = 0
+        pending = ""
+        # ``consumed`` characters of the decoded text are before ``pending``.
+        position = overlap = consumed = 0
+        for chunk in _decoded_chunks(view):
+            consumed += position
+            pending = pending[position:] + chunk
+            position = 0
+            while True:
+                end = _PARAGRAPH_BREAK.search(pending, position, position + MAX_SEGMENT_CHARS)
+                if end is not None:
+                    cut, following, next_overlap = end.start() + 1, end.end(), 0
+                elif len(pending) - position >= MAX_SEGMENT_CHARS:
+                    # No paragraph break in sight: cut at a line end if there is one.
+                    limit = position + MAX_SEGMENT_CHARS
+                    cut = pending.rfind("\n", limit - MAX_SEGMENT_CHARS // 2, limit) + 1 or limit
+                    following, next_overlap = cut - OVERLAP_CHARS, OVERLAP_CHARS
+                else:
+                    break
+                text = pending[position:cut]
+                if text[overlap:].strip():
+                    number += 1
+                    yield Segment(number, text, overlap, consumed + position)
+                position, overlap = following, next_overlap
+        text = pending[position:]
+        if text[overlap:].strip():
+            yield Segment(number + 1, text, overlap, consumed + position)
+
+
+def open_pdf(file):
+    """Return a PdfReader over ``file``, raising DocumentError if it cannot be read."""
+    try:
+        from pypdf import PdfReader
+    except ImportError as exc:
+        raise DocumentError("PDF support requires the 'pypdf' package.") from exc
+    try:
+        return PdfReader(file)
+    except Exception as exc:
+        raise DocumentError(f"Could not read PDF: {exc}") from exc
+
+
+def iter_pdf_pages(reader, first=1, last=None):
+    """Yield pages ``first`` to ``last`` (1-based, inclusive) of a PdfReader."""
+    last = len(reader.pages) if last is None else last
+    for number in range(first, last + 1):
+        yield Segment(number, reader.pages[number - 1].extract_text() or "")
+
+
+def _iter_pdf_pages(file):
+    return iter_pdf_pages(open_pdf(file))
+
+
+def _iter_docx_paragraphs(file):
+    try:
+        import docx
+    except ImportError as exc:
+        raise DocumentError("DOCX support requires the 'python-docx' package.") from exc
+    try:
+        document = docx.Document(file)
+    except Exception as exc:
+        raise DocumentError(f"Could not read DOCX: {exc}") from exc
+    number = 0
+    for paragraph in document.paragraphs:
+        if paragraph.text.strip():
+            number += 1
+            yield Segment(number, paragraph.text)
+    for table in document.tables:
+        for row in table.rows:
+            text = " | ".join(cell.text for cell in row.cells)
+            if text.strip(" |"):
+                number += 1
+                yield Segment(number, text)
+
+
+def scan_segment(segment, patterns, base_offset=0):
+    """Return the findings in one segment; offsets are document-relative."""
+    text = segment.text
+    findings = []
+    for match in patterns.iter_matches(text):
+        start, end = match.start, match.end
+        if end <= segment.overlap:
+            # Already reported from the end of the previous segment.
+            continue
+        context = text[max(0, start - CONTEXT_CHARS):end + CONTEXT_CHARS]
+        for source, key, severity in match.value:
+            findings.append(Finding(
+                source=source,
+                key=key,
+                severity=severity,
+                matched=text[start:end],
+                segment=segment.number,
+                offset=base_offset + start,
+                context=" ".join(context.split()),
+            ))
+    return findings
+
+
+def analyze_segments(segments, patterns, unit="paragraph", keep_text=False, fees=None):
+    """Scan a stream of segments, keeping only the findings in memory.
+
+    With ``keep_text`` the extracted text of every segment, less any overlap
+    with the segment before it, is kept in ``report.texts`` as well, unless the document runs past MAX_KEPT_CHARS,
+    in which case ``report.texts`` is left empty. With a FeeExtractor as
+    ``fees`` every amount is kept in ``report.amounts``, whatever the size.
+    """
+    report = DocumentReport(unit=unit)
+    for segment in segments:
+        start = segment.start
+        if start is None:
+            start = report.characters - segment.overlap
+            if report.segments and not segment.overlap:
+                # One separator between segments; a window continues the one before it.
+                start += 1
+        report.findings.extend(scan_segment(segment, patterns, start))
+        if fees is not None:
+            for amount in fees.scan_text(segment.text, segment.number, start):
+                if amount.offset + len(amount.matched) <= start + segment.overlap:
+                    # Already reported from the end of the previous segment.
+                    continue
+                while report.amounts and amount.offset < report.amounts[-1].offset + len(report.amounts[-1].matched):
+                    # A copy cut short at the end of the previous segment.
+                    report.amounts.pop()
+                report.amounts.append(amount)
+        if keep_text:
+            report.texts.append(segment.text[segment.overlap:])
+        report.segments += 1
+        report.characters = start + len(segment.text)
+        if keep_text and report.characters > MAX_KEPT_CHARS:
+            report.texts = []
+            keep_text = False
+    report.findings.sort(key=_finding_order)
+    return report
+
+
+def merge_reports(reports, unit="page", keep_text=False):
+    """Combine the reports of consecutive parts of one document, in order.
+
+    Offsets are shifted to be document-relative. Texts are kept only when
+    every part kept all of its own and the whole stays within MAX_KEPT_CHARS.
+    """
+    merged = DocumentReport(unit=unit)
+    for report in reports:
+        if merged.segments and report.segments:
+            merged.characters += 1
+        for finding in report.findings:
+            finding.offset += merged.characters
+        merged.findings.extend(report.findings)
+        merged.amounts.extend(replace(amount, offset=amount.offset + merged.characters) for amount in report.amounts)
+        if keep_text and len(report.texts) == report.segments:
+            merged.texts.extend(report.texts)
+        else:
+            keep_text = False
+        merged.segments += report.segments
+        merged.characters += report.characters
+    if not keep_text or merged.characters > MAX_KEPT_CHARS:
+        merged.texts = []
+    merged.findings.sort(key=_finding_order)
+    return merged
+
+
+def _finding_order(finding):
+    return SEVERITY_ORDER.get(finding.severity, len(SEVERITY_ORDER)), finding.offset
+
+
+def analyze_document(file, patterns, name=None, keep_text=False, fees=None):
+    """Extract and analyze an uploaded TXT, PDF or DOCX file."""
+    name = name or getattr(file, "name", "") or ""
+    return analyze_segments(iter_segments(file, name), patterns, document_unit(name), keep_text, fees)
@@ -0,0 +1,248 @@
+"""Dollar-amount, percentage and fee-label extraction for contract text.
+
+Every pattern is compiled once, when a FeeExtractor is built. A scan jumps
+between the characters an amount must contain - "$", "%" or the word
+"percent" - with str.find, then matches the number at each hit with
+anchored patterns, so text without amounts costs almost nothing.
+
+A fee label is found from its last word: a fee word ("fee", "premium",
+"deposit", ...) with up to two words in front of it, or a whole glossary
+term. The nearest label in the same line and sentence wins, looking before
+the amount first, and is mapped to the glossary term it names. Labelled
+amounts are totalled per fee by ``fee_table``; pandas is only imported
+there.
+"""
+import re
+import string
+from dataclasses import dataclass
+
+from agent_decoder.documents import glossary_aliases
+
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+_SCALE = r"\s?(?:million|thousand|[mk]\b)"
+_RANGE = r"\s*(?:-|–|—|to)\s*"
+
+_CURRENCY = re.compile(rf"\$\s?({_NUMBER})({_SCALE})?(?:{_RANGE}\$?\s?({_NUMBER})({_SCALE})?)?", re.IGNORECASE)
+
+# The number (or range) right before a "%" or "percent", searched for in a
+# short window that ends at the anchor.
+_PERCENT = re.compile(rf"({_NUMBER})(?:{_RANGE}({_NUMBER}))?\s?\Z")
+
+PERCENT_WORDS = ("percent", "Percent", "PERCENT")
+
+# Words that make the phrase in front of them a fee label.
+FEE_WORDS = ("fee", "premium", "charge", "commission", "deposit", "assessment", "cost", "tax", "insurance", "dues", "points")
+
+# Words never part of a fee label ("a fee", "the deposit").
+FILLER_WORDS = frozenset(("a", "an", "the", "to", "of", "for", "and", "or", "is", "are", "be", "by", "at", "in", "on", "per", "with", "will", "shall", "any", "all", "no"))
+
+# Words in front of a fee word that still belong to its label.
+LABEL_WORDS = 2
+
+# Characters searched before and after an amount for its label.
+LABEL_BEFORE = 80
+LABEL_AFTER = 40
+
+# Characters searched before a "%" for its number.
+PERCENT_WINDOW = 24
+
+# Label searches stop at line and sentence ends.
+_STOPS = ("\n", ". ", "; ")
+
+# An amount of the other kind between a label and an amount unbinds the
+# label. Searched in lowercased text.
+_OTHER_KIND = {"currency": re.compile(r"%|percent"), "percent": re.compile(r"\$")}
+
+_SCALES = {"k": 1e3, "thousand": 1e3, "m": 1e6, "million": 1e6}
+
+
+@dataclass(frozen=True)
+class Amount:
+    kind: str
+    low: float
+    high: float
+    matched: str
+    label: str
+    term: str
+    segment: int
+    offset: int
+
+
+def _value(number, scale=None):
+    value = float(number.replace(",", ""))
+    return value * _SCALES[scale.strip().lower()] if scale else value
+
+
+def _anchors(text):
+    """Sorted (position, kind) of every "$", "%" and "percent" in ``text``."""
+    anchors = []
+    for needle in ("$", "%", *PERCENT_WORDS):
+        position = text.find(needle)
+        while position != -1:
+            anchors.append((position, needle))
+            position = text.find(needle, position + 1)
+    anchors.sort()
+    return anchors
+
+
+class FeeExtractor:
+    """Finds currency amounts and percentages and names the fee each belongs to."""
+
+    def __init__(self, glossary):
+        self.terms = {}
+        for term in glossary:
+            for alias in glossary_aliases(term):
+                self.terms[alias.lower()] = term
+        # Aliases by last word, longest first, so "title insurance" beats "insurance".
+        self._aliases = {}
+        for alias in sorted(self.terms, key=len, reverse=True):
+            self._aliases.setdefault(alias.split()[-1], []).append(alias)
+        heads = "|".join(map(re.escape, sorted(set(self._aliases) | set(FEE_WORDS), key=len, reverse=True)))
+        self._head = re.compile(rf"\b({heads})s?\b")
+        # The last head in a window: the greedy prefix backs off from the end,
+        # so only the text after that head is tried.
+        self._last_head = re.compile(rf"(?s:.*)\b({heads})s?\b")
+        self._alias = re.compile(rf"\b(?:{'|'.join(map(re.escape, self.terms))})\b")
+
+    def _label_start(self, window, head):
+        """Start of the label ending in ``head`` within a lowercased window, and its term."""
+        word = head.group(1)
+        word_end = head.end(1)
+        for alias in self._aliases.get(word, ()):
+            start = word_end - len(alias)
+            if start >= 0 and window.startswith(alias, start):
+                return start, self.terms[alias]
+        if word.endswith("s") and word[:-1] in FEE_WORDS:
+            # A plural glossary head ("closing costs") that no alias matched.
+            word = word[:-1]
+        if word not in FEE_WORDS:
+            return None
+        start = head.start(1)
+        for _ in range(LABEL_WORDS):
+            before = window[:start].rstrip()
+            if len(before) == start:
+                break
+            word_start = max(map(before.rfind, " \t\n")) + 1
+            word = before[word_start:]
+            if word in FILLER_WORDS or not word.replace("'", "").replace("’", "").isalpha():
+                break
+            start = word_start
+        alias = self._alias.search(window, start, head.end())
+        return start, self.terms[alias.group()] if alias else ""
+
+    def label(self, text, start, end, kind, previous=None):
+        """Return (label, glossary term) for the ``kind`` amount at text[start:end].
+
+        Labels are looked for in the same line and sentence only, before the
+        amount first. ``previous`` is the (end, kind) of the amount before
+        this one in ``text``; the search before the amount stops there. A
+        label before the amount does not carry over an amount of the other
+        kind, nor does one that belongs to the amount before it ("a 3%
+        commission on the $400,000 price").
+        """
+        low = max(start - LABEL_BEFORE, 0)
+        if previous is not None and previous[0] > low:
+            low = previous[0]
+        for stop in _STOPS:
+            found = text.rfind(stop, low, start)
+            if found != -1:
+                low = found + len(stop)
+        window = text[low:start].lower()
+        head = self._last_head.match(window)
+        while head is not None:
+            found = self._label_start(window, head)
+            if found is None:
+                head = self._last_head.match(window, 0, head.start(1))
+                continue
+            bound = (
+                previous is not None and previous[1] != kind and previous[0] == low
+                and not window[:found[0]].strip()
+            )
+            if not bound and not _OTHER_KIND[kind].search(window, head.end()):
+                return text[low + found[0]:low + head.end()], found[1]
+            break
+
+        high = end + LABEL_AFTER
+        for stop in _STOPS:
+            found = text.find(stop, end, high)
+            if found != -1:
+                high = found
+        window = text[end:high].lower()
+        for head in self._head.finditer(window):
+            found = self._label_start(window, head)
+            if found is not None:
+                return text[end + found[0]:end + head.end()], found[1]
+        return "", ""
+
+    def scan_text(self, text, segment=1, base_offset=0):
+        """Yield every Amount in one segment of text, offset by ``base_offset``."""
+        position = 0
+        previous = None
+        for anchor, needle in _anchors(text):
+            if anchor < position:
+                continue
+            if needle == "$":
+                match = _CURRENCY.match(text, anchor)
+                if match is None:
+                    continue
+                low = _value(match.group(1), match.group(2) or match.group(4))
+                high = _value(match.group(3), match.group(4) or match.group(2)) if match.group(3) else low
+                kind, start, end = "currency", match.start(), match.end()
+            else:
+                end = anchor + len(needle)
+                if text[end:end + 1].isalpha():
+                    # "percentage", "percentile"
+                    continue
+                match = _PERCENT.search(text, max(position, anchor - PERCENT_WINDOW), anchor)
+                if match is None:
+                    continue
+                low = _value(match.group(1))
+                high = _value(match.group(2)) if match.group(2) else low
+                kind, start = "percent", match.start()
+            label, term = self.label(text, start, end, kind, previous)
+            position = end
+            previous = (end, kind)
+            yield Amount(kind, min(low, high), max(low, high), text[start:end], label, term, segment, base_offset + start)
+
+    def scan(self, texts):
+        """Every Amount in a document's segment texts, numbered from 1."""
+        amounts = []
+        for number, text in enumerate(texts, start=1):
+            amounts.extend(self.scan_text(text, number))
+        return amounts
+
+
+def fee_table(amounts):
+    """Total the labelled amounts per fee.
+
+    One row per glossary term (or per label for fees the glossary does not
+    cover) with the number of mentions, the low and high dollar totals and
+    the percentages quoted, followed by a "Total" row.
+    """
+    import pandas as pd
+
+    columns = ["Fee", "Glossary Term", "Mentions", "Low ($)", "High ($)", "Rates (%)"]
+    rows = [{
+        "Fee": amount.term or string.capwords(amount.label),
+        "Glossary Term": amount.term,
+        "Low ($)": amount.low if amount.kind == "currency" else 0.0,
+        "High ($)": amount.high if amount.kind == "currency" else 0.0,
+        "Rate": (f"{amount.low:g}" if amount.low == amount.high else f"{amount.low:g}-{amount.high:g}")
+        if amount.kind == "percent" else None,
+    } for amount in amounts if amount.label]
+    if not rows:
+        return pd.DataFrame(columns=columns)
+
+    frame = pd.DataFrame(rows)
+    table = frame.groupby(["Fee", "Glossary Term"], sort=False).agg(**{
+        "Mentions": ("Fee", "size"),
+        "Low ($)": ("Low ($)", "sum"),
+        "High ($)": ("High ($)", "sum"),
+        "Rates (%)": ("Rate", lambda rates: ", ".join(dict.fromkeys(rates.dropna()))),
+    }).reset_index()
+    table = table.sort_values("High ($)", ascending=False, kind="stable")
+    total = {
+        "Fee": "Total", "Glossary Term": "", "Mentions": int(table["Mentions"].sum()),
+        "Low ($)": table["Low ($)"].sum(), "High ($)": table["High ($)"].sum(), "Rates (%)": "",
+    }
+    return pd.concat([table, pd.DataFrame([total])], ignore_index=True)[columns]
@@ -0,0 +1,248 @@
+"""Typo- and paraphrase-tolerant phrase lookup over a character n-gram index.
+
+Phrases are normalized (contractions expanded, text-speak such as "2" or "u"
+spelled out, punctuation dropped) and broken into character trigrams. An
+inverted index from trigram to phrase narrows each lookup to the handful of
+phrases that share enough trigrams with the input, and only those candidates
+are scored, so lookups stay fast as the phrase corpus grows.
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+NGRAM = 3
+
+# Whole-token rewrites applied before indexing and lookup.
+TOKEN_SUBSTITUTIONS = {
+    "2": "to",
+    "4": "for",
+    "u": "you",
+    "ur": "your",
+    "r": "are",
+    "b4": "before",
+    "gonna": "going to",
+    "wanna": "want to",
+    "gotta": "got to",
+    "tmrw": "tomorrow",
+    "tonite": "tonight",
+    "pls": "please",
+    "w/": "with",
+}
+
+CONTRACTIONS = {
+    "won't": "will not",
+    "can't": "can not",
+    "cannot": "can not",
+    "shan't": "shall not",
+    "let's": "let us",
+    # Contractions typed without the apostrophe. Forms that are also words
+    # ("well", "were", "its") are left alone.
+    "wont": "will not",
+    "cant": "can not",
+    "dont": "do not",
+    "doesnt": "does not",
+    "didnt": "did not",
+    "isnt": "is not",
+    "arent": "are not",
+    "wasnt": "was not",
+    "havent": "have not",
+    "hasnt": "has not",
+    "wouldnt": "would not",
+    "shouldnt": "should not",
+    "couldnt": "could not",
+    "youre": "you are",
+    "theyre": "they are",
+    "youll": "you will",
+    "youve": "you have",
+}
+
+_CONTRACTION_SUFFIXES = (
+    ("n't", " not"),
+    ("'re", " are"),
+    ("'ll", " will"),
+    ("'ve", " have"),
+    ("'m", " am"),
+    ("'d", " would"),
+)
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"'})
+_TOKEN = re.compile(r"\S+")
+_STRIP = re.compile(r"[^a-z0-9' ]+")
+_CLAUSE = re.compile(r"[^.!?;\n]+")
+_PARENTHETICAL = re.compile(r"\s*\([^)]*\)")
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    phrase: str
+    value: object
+    score: float
+    start: int
+    end: int
+
+
+def normalize_token(token):
+    """Return the normalized words a single raw token stands for."""
+    token = token.translate(_QUOTES).lower()
+    if token in TOKEN_SUBSTITUTIONS:
+        return TOKEN_SUBSTITUTIONS[token].split()
+    token = _STRIP.sub("", token).strip("'")
+    if token in TOKEN_SUBSTITUTIONS:
+        return TOKEN_SUBSTITUTIONS[token].split()
+    if token in CONTRACTIONS:
+        return CONTRACTIONS[token].split()
+    for suffix, replacement in _CONTRACTION_SUFFIXES:
+        if token.endswith(suffix) and len(token) > len(suffix):
+            return (token[:-len(suffix)] + replacement).split()
+    token = token.replace("'", "")
+    return [token] if token else []
+
+
+def normalize(text):
+    """Normalize free text into a single space-separated string."""
+    words = []
+    for token in _TOKEN.findall(text):
+        words.extend(normalize_token(token))
+    return " ".join(words)
+
+
+def ngrams(normalized):
+    """Character trigrams of a normalized string, padded at the edges."""
+    padded = f" {normalized} "
+    return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+@lru_cache(maxsize=65536)
+def _word_ngrams(word):
+    return frozenset(ngrams(word))
+
+
+def _dice(a, b):
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+class FuzzyPhraseIndex:
+    """Precomputed n-gram index answering approximate phrase lookups.
+
+    ``phrases`` maps each phrase to the value returned with its matches.
+    """
+
+    def __init__(self, phrases):
+        self._phrases = []
+        self._values = []
+        self._grams = []
+        self._lengths = []
+        self._postings = {}
+        for phrase, value in phrases.items():
+            normalized = normalize(phrase)
+            if not normalized:
+                continue
+            phrase_id = len(self._phrases)
+            grams = ngrams(normalized)
+            self._phrases.append(phrase)
+            self._values.append(value)
+            self._grams.append(grams)
+            self._lengths.append(len(normalized.split()))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(phrase_id)
+
+    def __len__(self):
+        return len(self._phrases)
+
+    def _candidates(self, grams, min_containment):
+        counts = Counter()
+        postings = self._postings
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids:
+                counts.update(ids)
+        return [
+            phrase_id for phrase_id, shared in counts.items()
+            if shared >= min_containment * len(self._grams[phrase_id])
+        ]
+
+    def lookup(self, query, threshold=0.5, limit=5):
+        """Return the phrases most similar to a short query, best first."""
+        grams = ngrams(normalize(query))
+        scored = []
+        for phrase_id in self._candidates(grams, threshold * 0.75):
+            score = _dice(grams, self._grams[phrase_id])
+            if score >= threshold:
+                scored.append(FuzzyMatch(self._phrases[phrase_id], self._values[phrase_id], round(score, 3), 0, len(query)))
+        scored.sort(key=lambda m: -m.score)
+        return scored[:limit]
+
+    def search(self, text, threshold=0.7):
+        """Find approximate phrase occurrences anywhere in a long text.
+
+        The text is split into clauses; each clause is checked against the
+        index and only candidate phrases are aligned against word windows of
+        about their own length. Returns the best window per phrase per clause.
+        Clauses that repeat (quoted replies, signatures) are scored once.
+        """
+        results = []
+        seen = {}
+        for clause in _CLAUSE.finditer(text):
+            words, spans = [], []
+            for token in _TOKEN.finditer(clause.group()):
+                span = (clause.start() + token.start(), clause.start() + token.end())
+                for word in normalize_token(token.group()):
+                    words.append(word)
+                    spans.append(span)
+            if not words:
+                continue
+            key = " ".join(words)
+            if key not in seen:
+                seen[key] = [
+                    (phrase_id, score, first, last)
+                    for phrase_id in self._candidates(ngrams(key), threshold * 0.75)
+                    for score, first, last in [self._align(phrase_id, words)]
+                    if score >= threshold
+                ]
+            for phrase_id, score, first, last in seen[key]:
+                results.append(FuzzyMatch(
+                    self._phrases[phrase_id], self._values[phrase_id], score,
+                    spans[first][0], spans[last][1],
+                ))
+        results.sort(key=lambda m: (m.start, -m.score))
+        return results
+
+    def _align(self, phrase_id, words):
+        """Score the best window of ``words`` against one phrase.
+
+        Windows only start and end on words sharing a trigram with the
+        phrase, which keeps the alignment cheap on long clauses.
+        """
+        target = self._grams[phrase_id]
+        length = self._lengths[phrase_id]
+        hits = [i for i, word in enumerate(words) if not _word_ngrams(word).isdisjoint(target)]
+        best = (0.0, 0, 0)
+        for a, first in enumerate(hits):
+            for last in hits[a:]:
+                size = last - first + 1
+                if size > length + 1:
+                    break
+                if size < length - 1:
+                    continue
+                score = _dice(ngrams(" ".join(words[first:last + 1])), target)
+                if score > best[0]:
+                    best = (score, first, last)
+        return (round(best[0], 3),) + best[1:]
+
+
+def build_phrase_index(realtor_speak, psychology):
+    """Index realtor-speak phrases and psychology tactic examples together.
+
+    Values are ``(source, key, detail)`` tuples: ``("realtor_speak", phrase,
+    meaning)`` or ``("psychology", tactic, example)``.
+    """
+    phrases = {}
+    for phrase, meaning in realtor_speak.items():
+        phrases[phrase] = ("realtor_speak", phrase, meaning)
+    for tactic, details in psychology.items():
+        for example in details["examples"]:
+            phrases[_PARENTHETICAL.sub("", example)] = ("psychology", tactic, example)
+    return FuzzyPhraseIndex(phrases)
@@ -0,0 +1,141 @@
+"""Aho-Corasick phrase automaton for single-pass multi-phrase matching.
+
+The automaton is compiled once from a phrase table and then finds every
+occurrence of every phrase in one left-to-right pass over the input, so
+matching cost depends on the length of the text rather than on how many
+phrases are in the table. Matching ignores case, treats curly quotes as
+straight ones and lets any run of whitespace stand in for a single space.
+"""
+from dataclasses import dataclass
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"'})
+
+
+@dataclass(frozen=True)
+class Match:
+    start: int
+    end: int
+    phrase: str
+    value: object
+
+
+def normalize(text):
+    """Lowercase, straighten quotes and collapse whitespace."""
+    return " ".join(text.translate(_QUOTES).lower().split())
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+
+class PhraseAutomaton:
+    """Match every phrase of a table against text in one linear pass.
+
+    ``phrases`` maps each phrase to the value returned with its matches.
+    Phrases are normalized, so "Buyer’s  Premium" and "buyer's premium" are
+    the same key; if two phrases normalize alike the later value wins.
+    """
+
+    def __init__(self, phrases, whole_words=True):
+        self.whole_words = whole_words
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        self._phrases = []
+        self._values = []
+        index = {}
+        for phrase, value in phrases.items():
+            key = normalize(phrase)
+            if not key:
+                continue
+            if key in index:
+                self._values[index[key]] = value
+                continue
+            index[key] = len(self._phrases)
+            self._phrases.append(phrase)
+            self._values.append(value)
+            self._insert(key, index[key])
+        self._longest = max((len(normalize(p)) for p in self._phrases), default=0)
+        self._build_failure_links()
+
+    def __len__(self):
+        return len(self._phrases)
+
+    def _insert(self, key, pattern_id):
+        state = 0
+        for char in key:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = ((pattern_id, len(key)),)
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Fold the outputs of the failure chain in once, at build time.
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text):
+        """Yield a :class:`Match` for every phrase occurrence in ``text``.
+
+        Matches are reported in order of their end position with offsets into
+        the original, unnormalized ``text``.
+        """
+        if not self._phrases:
+            return
+        lowered = text.translate(_QUOTES).lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to more than one; fold them one by one.
+            lowered = "".join(c.translate(_QUOTES).lower()[:1] or c for c in text)
+        goto, fail, out = self._goto, self._fail, self._out
+        ring = self._longest or 1
+        positions = [0] * ring
+        consumed = 0
+        state = 0
+        previous_space = True
+        for position, char in enumerate(lowered):
+            if char.isspace():
+                if previous_space:
+                    continue
+                char = " "
+                previous_space = True
+            else:
+                previous_space = False
+            positions[consumed % ring] = position
+            consumed += 1
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id, length in out[state]:
+                start = positions[(consumed - length) % ring]
+                end = position + 1
+                if self.whole_words and not self._on_word_boundaries(text, start, end):
+                    continue
+                yield Match(start, end, self._phrases[pattern_id], self._values[pattern_id])
+
+    def find_all(self, text):
+        """Return every match in ``text`` ordered by start position."""
+        return sorted(self.iter_matches(text), key=lambda m: (m.start, -m.end))
+
+    @staticmethod
+    def _on_word_boundaries(text, start, end):
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return False
+        if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+            return False
+        return True
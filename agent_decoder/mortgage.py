@@ -0,0 +1,145 @@
+"""Mortgage amortization, PMI drop-off and discount point break-even.
+
+Schedules are computed in closed form as NumPy arrays rather than month by
+month, and memoized on the loan parameters, so comparing many offers that
+share a loan amount, rate and term reuses the same read-only schedule.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# PMI can be cancelled once the balance reaches this share of the home's value.
+PMI_REMOVAL_LTV = 0.80
+
+# Typical rate reduction bought by one discount point, in percentage points.
+RATE_REDUCTION_PER_POINT = 0.25
+
+
+@dataclass(frozen=True)
+class Schedule:
+    payment: float
+    month: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+
+    @property
+    def total_interest(self):
+        return float(self.interest.sum())
+
+    def to_frame(self):
+        return pd.DataFrame({
+            "month": self.month,
+            "payment": self.payment,
+            "interest": self.interest,
+            "principal": self.principal,
+            "balance": self.balance,
+        })
+
+
+@dataclass(frozen=True)
+class LoanOffer:
+    price: float
+    down_payment: float
+    rate: float
+    term_years: int = 30
+    points: float = 0.0
+    pmi_rate: float = 0.5
+    label: str = ""
+
+    @property
+    def loan_amount(self):
+        return self.price - self.down_payment
+
+
+def monthly_payment(principal, annual_rate, months):
+    """Level monthly payment; works element-wise on arrays."""
+    principal = np.asarray(principal, dtype=float)
+    r = np.asarray(annual_rate, dtype=float) / 1200
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = np.where(r > 0, principal * r / (1 - (1 + r) ** -months), principal / months)
+    return payment.item() if payment.ndim == 0 else payment
+
+
+@lru_cache(maxsize=1024)
+def _schedule(principal, annual_rate, months):
+    r = annual_rate / 1200
+    payment = monthly_payment(principal, annual_rate, months)
+    month = np.arange(1, months + 1)
+    if r > 0:
+        growth = (1 + r) ** month
+        balance = principal * growth - payment * (growth - 1) / r
+    else:
+        balance = principal - payment * month
+    balance = np.maximum(balance, 0.0)
+    balance[-1] = 0.0
+    previous = np.concatenate(([principal], balance[:-1]))
+    interest = previous * r
+    principal_paid = previous - balance
+    for array in (month, interest, principal_paid, balance):
+        array.setflags(write=False)
+    return Schedule(payment, month, interest, principal_paid, balance)
+
+
+def amortization_schedule(principal, annual_rate, term_years=30):
+    """Full monthly schedule for a fixed-rate loan (memoized, read-only)."""
+    return _schedule(round(float(principal), 2), round(float(annual_rate), 4), int(term_years) * 12)
+
+
+def pmi_removal_month(schedule, home_value, ltv=PMI_REMOVAL_LTV):
+    """First month the balance is at or below ``ltv`` of the home value.
+
+    Returns 0 when the loan starts below that threshold (no PMI) and None if
+    it is never reached.
+    """
+    threshold = home_value * ltv
+    if schedule.balance.size == 0 or schedule.balance[0] + schedule.principal[0] <= threshold:
+        return 0
+    index = int(np.searchsorted(-schedule.balance, -threshold))
+    return int(schedule.month[index]) if index < schedule.month.size else None
+
+
+def points_break_even(principal, annual_rate, points, term_years=30, reduction_per_point=RATE_REDUCTION_PER_POINT):
+    """Months until discount points pay for themselves.
+
+    Returns (points_cost, monthly_savings, break_even_months); the months are
+    None when the points never save money.
+    """
+    months = int(term_years) * 12
+    cost = principal * points / 100
+    bought_rate = max(annual_rate - points * reduction_per_point, 0.0)
+    savings = monthly_payment(principal, annual_rate, months) - monthly_payment(principal, bought_rate, months)
+    if savings <= 0:
+        return cost, savings, None
+    return cost, savings, float(np.ceil(cost / savings))
+
+
+def compare_offers(offers, reduction_per_point=RATE_REDUCTION_PER_POINT):
+    """Summarize loan offers side by side, one row per offer.
+
+    Each offer's ``rate`` is the rate after any points it buys.
+    """
+    rows = []
+    for number, offer in enumerate(offers, start=1):
+        loan = offer.loan_amount
+        schedule = amortization_schedule(loan, offer.rate, offer.term_years)
+        removal = pmi_removal_month(schedule, offer.price)
+        pmi_months = schedule.month.size if removal is None else removal
+        pmi_monthly = loan * offer.pmi_rate / 1200 if pmi_months else 0.0
+        points_cost = loan * offer.points / 100
+        rows.append({
+            "offer": offer.label or f"Offer {number}",
+            "loan_amount": loan,
+            "rate": offer.rate,
+            "points": offer.points,
+            "monthly_payment": schedule.payment,
+            "pmi_monthly": pmi_monthly,
+            "pmi_months": pmi_months,
+            "total_interest": schedule.total_interest,
+            "total_pmi": pmi_monthly * pmi_months,
+            "points_cost": points_cost,
+            "total_cost": schedule.total_interest + pmi_monthly * pmi_months + points_cost,
+        })
+    return pd.DataFrame(rows)
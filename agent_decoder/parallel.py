@@ -0,0 +1,118 @@
+"""Page-sharded PDF extraction and analysis across a process pool.
+
+A multi-page PDF is cut into runs of PAGES_PER_SHARD pages. The upload is
+written once to a temporary file that every worker opens once and keeps, so
+only page numbers go to the workers and only shard reports come back. The
+shard reports are merged in page order, and a progress callback hears about
+every shard as it completes. Pools are started once per worker count, from
+a forkserver (or spawn) context so the threads of a running server are never
+forked, and shared by every upload::
+
+    report = analyze_pdf(uploaded_file, progress=lambda done, total: ...)
+"""
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from agent_decoder.core import document_patterns, fee_extractor
+from agent_decoder.documents import analyze_segments, iter_pdf_pages, merge_reports, open_pdf, upload_buffer
+
+PAGES_PER_SHARD = 8
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def shards(pages, pages_per_shard=PAGES_PER_SHARD):
+    """(first, last) page ranges, 1-based and inclusive, covering ``pages`` pages."""
+    return [(first, min(first + pages_per_shard - 1, pages)) for first in range(1, pages + 1, pages_per_shard)]
+
+
+def _scan(reader, first, last, keep_text, amounts):
+    fees = fee_extractor() if amounts else None
+    return analyze_segments(iter_pdf_pages(reader, first, last), document_patterns(), "page", keep_text, fees)
+
+
+@lru_cache(maxsize=1)
+def _worker_reader(path):
+    # Each worker parses the file once and keeps it open for all its shards.
+    return open_pdf(open(path, "rb"))
+
+
+def _pool(workers):
+    """The shared process pool with ``workers`` workers, started on first use."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            pool = _pools[workers] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(method), initializer=document_patterns,
+            )
+        return pool
+
+
+def _discard_pool(workers, pool):
+    with _pools_lock:
+        if _pools.get(workers) is pool:
+            del _pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def analyze_pages(path, first, last, keep_text=False, amounts=False):
+    """Extract and scan pages ``first`` to ``last`` of the PDF at ``path``; runs inside a worker."""
+    return _scan(_worker_reader(path), first, last, keep_text, amounts)
+
+
+def analyze_pdf(file, workers=None, pages_per_shard=PAGES_PER_SHARD, keep_text=False, amounts=False, progress=None):
+    """Analyze an uploaded PDF with its pages spread over a process pool.
+
+    ``workers`` defaults to the CPU count; ``workers=0``, a single CPU or a
+    PDF of one shard run in the current process instead. ``progress(done,
+    total)`` is called from the calling thread with the number of pages
+    scanned so far each time a shard completes. With ``amounts`` the
+    report's ``amounts`` hold every dollar amount and percentage found.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+        workers = 0 if workers == 1 else workers
+    file.seek(0)
+    reader = open_pdf(file)
+    total = len(reader.pages)
+    ranges = shards(total, pages_per_shard)
+    reports = [None] * len(ranges)
+    done = 0
+
+    if workers == 0 or len(ranges) < 2:
+        for index, (first, last) in enumerate(ranges):
+            reports[index] = _scan(reader, first, last, keep_text, amounts)
+            done += reports[index].segments
+            if progress:
+                progress(done, total)
+        return merge_reports(reports, "page", keep_text)
+
+    descriptor, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(descriptor, "wb") as spill, upload_buffer(file) as view:
+            spill.write(view)
+        pool = _pool(workers)
+        try:
+            futures = {
+                pool.submit(analyze_pages, path, first, last, keep_text, amounts): index
+                for index, (first, last) in enumerate(ranges)
+            }
+            for future in as_completed(futures):
+                report = reports[futures[future]] = future.result()
+                done += report.segments
+                if progress:
+                    progress(done, total)
+        except BrokenProcessPool:
+            # A worker died; the next upload starts a fresh pool.
+            _discard_pool(workers, pool)
+            raise
+    finally:
+        os.unlink(path)
+    return merge_reports(reports, "page", keep_text)
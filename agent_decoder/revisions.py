@@ -0,0 +1,192 @@
+"""Clause-level comparison of two revisions of a document.
+
+Sequences are interned to integers and aligned with Myers' O(ND) diff
+after trimming their common prefix and suffix. Pages (or paragraphs) are
+aligned first; only runs that differ are split into clauses (sentences, or
+numbered/lettered items), normalized and aligned again. Only clauses the
+diff reports as added, removed or rewritten are scanned for findings, so
+the cost of re-analysis follows the size of the edit rather than the size
+of the document.
+"""
+import re
+from dataclasses import dataclass, field
+
+from agent_decoder.documents import Segment, scan_segment
+from agent_decoder.matching import normalize
+
+# Sentence ends, or the start of a numbered/lettered item on a new line.
+_CLAUSE_BREAK = re.compile(r"(?<=[.;:!?])\s+(?=[\"'(\[]?[A-Z0-9])|\n\s*\n|\n(?=\s*(?:\d+(?:\.\d+)*[.)]|\([a-z0-9]+\))\s)")
+
+# Diffs needing more edits than this are reported as one wholesale rewrite.
+# The trace kept for backtracking grows with the square of the edit count.
+MAX_EDITS = 2000
+
+
+@dataclass(frozen=True)
+class Clause:
+    segment: int
+    text: str
+
+
+@dataclass
+class ClauseChange:
+    kind: str
+    old: list
+    new: list
+    added_findings: list = field(default_factory=list)
+    removed_findings: list = field(default_factory=list)
+
+
+@dataclass
+class RevisionDiff:
+    old_segments: int
+    new_segments: int
+    changed_segments: int
+    changes: list
+
+    @property
+    def added_findings(self):
+        return [finding for change in self.changes for finding in change.added_findings]
+
+    @property
+    def removed_findings(self):
+        return [finding for change in self.changes for finding in change.removed_findings]
+
+
+def split_clauses(texts, first=1):
+    """Split segment texts (pages or paragraphs) into Clauses, numbered from ``first``."""
+    clauses = []
+    for number, text in enumerate(texts, start=first):
+        for piece in _CLAUSE_BREAK.split(text):
+            piece = " ".join(piece.split())
+            if piece:
+                clauses.append(Clause(number, piece))
+    return clauses
+
+
+def _myers(a, b):
+    """Matched index pairs of a shortest edit script between sequences a and b."""
+    n, m = len(a), len(b)
+    limit = min(n + m, MAX_EDITS)
+    if abs(n - m) > limit:
+        # Needs more edits than the limit allows before any step is taken.
+        return None
+    # v[offset + k] is the furthest x reached on diagonal k = x - y.
+    offset = limit + 1
+    v = [0] * (2 * offset + 1)
+    trace = []
+    for d in range(limit + 1):
+        # Only diagonals -d..d are live at step d; keep just those.
+        trace.append(v[offset - d:offset + d + 1])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+    return None
+
+
+def _backtrack(trace, x, y):
+    matches = []
+    for d in range(len(trace) - 1, -1, -1):
+        # trace[d] holds diagonals -d..d of the step before d, so k sits at d + k.
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[d + k - 1] < v[d + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[d + prev_k] if d else 0
+        prev_y = prev_x - prev_k if d else 0
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        x, y = prev_x, prev_y
+    matches.reverse()
+    return matches
+
+
+def diff_opcodes(a, b):
+    """difflib-style ("equal"|"replace"|"delete"|"insert", i1, i2, j1, j2) opcodes."""
+    prefix = 0
+    while prefix < len(a) and prefix < len(b) and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < len(a) - prefix and suffix < len(b) - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    core = _myers(a[prefix:len(a) - suffix], b[prefix:len(b) - suffix]) or []
+    matches = (
+        [(i, i) for i in range(prefix)]
+        + [(prefix + x, prefix + y) for x, y in core]
+        + [(len(a) - suffix + i, len(b) - suffix + i) for i in range(suffix)]
+    )
+
+    opcodes = []
+    i = j = 0
+    for x, y in matches + [(len(a), len(b))]:
+        if i < x or j < y:
+            tag = "replace" if i < x and j < y else "delete" if i < x else "insert"
+            opcodes.append((tag, i, x, j, y))
+        if x < len(a):
+            if opcodes and opcodes[-1][0] == "equal" and opcodes[-1][2] == x:
+                _, i1, _, j1, _ = opcodes.pop()
+                opcodes.append(("equal", i1, x + 1, j1, y + 1))
+            else:
+                opcodes.append(("equal", x, x + 1, y, y + 1))
+        i, j = x + 1, y + 1
+    return opcodes
+
+
+def _scan(clauses, patterns):
+    findings = []
+    for clause in clauses:
+        findings.extend(scan_segment(Segment(clause.segment, clause.text), patterns))
+    return findings
+
+
+def _interned(sequences, key=lambda item: item):
+    ids = {}
+    return [[ids.setdefault(key(item), len(ids)) for item in sequence] for sequence in sequences]
+
+
+def compare_texts(old_texts, new_texts, patterns):
+    """Align two revisions' segment texts clause by clause and scan only the changes.
+
+    Identical segments are matched first, whole, so only runs of segments
+    that differ are split into clauses and diffed again. A change's
+    ``added_findings`` are findings in its new clauses whose (source, key)
+    does not appear in its old clauses; ``removed_findings`` the reverse.
+    """
+    old_texts, new_texts = list(old_texts), list(new_texts)
+    changes, changed_segments = [], 0
+    for tag, i1, i2, j1, j2 in diff_opcodes(*_interned([old_texts, new_texts])):
+        if tag == "equal":
+            continue
+        changed_segments += max(i2 - i1, j2 - j1)
+        old = split_clauses(old_texts[i1:i2], i1 + 1)
+        new = split_clauses(new_texts[j1:j2], j1 + 1)
+        a, b = _interned([old, new], lambda clause: normalize(clause.text))
+        for tag, k1, k2, l1, l2 in diff_opcodes(a, b):
+            if tag != "equal":
+                changes.append(_change(tag, old[k1:k2], new[l1:l2], patterns))
+    return RevisionDiff(len(old_texts), len(new_texts), changed_segments, changes)
+
+
+def _change(tag, before, after, patterns):
+    old_findings, new_findings = _scan(before, patterns), _scan(after, patterns)
+    old_keys = {(f.source, f.key) for f in old_findings}
+    new_keys = {(f.source, f.key) for f in new_findings}
+    kind = {"replace": "modified", "delete": "removed", "insert": "added"}[tag]
+    return ClauseChange(
+        kind, before, after,
+        [f for f in new_findings if (f.source, f.key) not in old_keys],
+        [f for f in old_findings if (f.source, f.key) not in new_keys],
+    )
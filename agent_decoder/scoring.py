@@ -0,0 +1,106 @@
+"""Weighted, rule-driven risk scoring for red flag checklists.
+
+The rules table (``data/risk_rules.json``) gives each severity a weight,
+each category a multiplier, bonus points for flags that are worse together,
+score floors for flags and severities serious enough on their own, and the
+bands the final score falls into. :class:`RiskScorer` compiles that table
+once so scoring a checklist only touches the flags that were selected.
+"""
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Contribution:
+    label: str
+    points: float
+    explanation: str
+
+
+@dataclass(frozen=True)
+class RiskAssessment:
+    score: float
+    band: str
+    raw_points: float
+    flags: tuple
+    critical: int
+    contributions: tuple
+    unknown: tuple = ()
+
+
+class RiskScorer:
+    """Score sets of red flags against a compiled rules table."""
+
+    def __init__(self, red_flags, rules):
+        severity_weights = rules["severity_weights"]
+        multipliers = rules["category_multipliers"]
+        self._flags = {}
+        for flag, details in red_flags.items():
+            points = severity_weights.get(details["severity"], 0) * multipliers.get(details["category"], 1.0)
+            explanation = f"{details['severity']} {details['category'].lower()} red flag: {details['why_dangerous']}"
+            self._flags[flag] = (details["category"], details["severity"], round(points, 2), explanation)
+
+        # Combination rules indexed by the flag or category that can trigger them.
+        self._by_flag = {}
+        self._by_category = {}
+        for rule in rules["combinations"]:
+            if "all_of" in rule:
+                for flag in rule["all_of"]:
+                    self._by_flag.setdefault(flag, []).append(rule)
+            else:
+                self._by_category.setdefault(rule["category"], []).append(rule)
+
+        # A flag's floor is the higher of its own and its severity's.
+        severity_floors = rules.get("severity_minimum_scores", {})
+        self._minimum_scores = {
+            flag: float(severity_floors.get(severity, 0.0)) for flag, (_, severity, _, _) in self._flags.items()
+        }
+        for flag, minimum in rules.get("minimum_scores", {}).items():
+            self._minimum_scores[flag] = max(self._minimum_scores.get(flag, 0.0), float(minimum))
+        self._scale = float(rules["calibration_scale"])
+        self._bands = sorted(rules["bands"], key=lambda band: -band["min_score"])
+
+    def band(self, score):
+        for band in self._bands:
+            if score >= band["min_score"]:
+                return band["name"]
+        return self._bands[-1]["name"]
+
+    def score(self, selected):
+        """Assess an iterable of selected flag names."""
+        flags, unknown = [], []
+        for flag in dict.fromkeys(selected):
+            (flags if flag in self._flags else unknown).append(flag)
+        chosen = set(flags)
+
+        contributions = []
+        category_counts = {}
+        critical = 0
+        floor = 0.0
+        for flag in flags:
+            category, severity, points, explanation = self._flags[flag]
+            contributions.append(Contribution(flag, points, explanation))
+            category_counts[category] = category_counts.get(category, 0) + 1
+            critical += severity == "Critical"
+            floor = max(floor, self._minimum_scores.get(flag, 0.0))
+
+        fired = set()
+        for flag in flags:
+            for rule in self._by_flag.get(flag, ()):
+                if rule["name"] not in fired and chosen.issuperset(rule["all_of"]):
+                    fired.add(rule["name"])
+                    contributions.append(Contribution(rule["name"], rule["points"], rule["explanation"]))
+        for category, count in category_counts.items():
+            for rule in self._by_category.get(category, ()):
+                if count >= rule["min_count"]:
+                    contributions.append(Contribution(rule["name"], rule["points"], rule["explanation"]))
+
+        raw = sum(c.points for c in contributions)
+        score = round(max(100 * (1 - math.exp(-raw / self._scale)), floor if flags else 0.0), 1)
+        contributions.sort(key=lambda c: -c.points)
+        return RiskAssessment(score, self.band(score), round(raw, 2), tuple(flags), critical, tuple(contributions), tuple(unknown))
+
+    def score_many(self, submissions):
+        """Yield an assessment for each checklist in ``submissions``."""
+        for selected in submissions:
+            yield self.score(selected)
@@ -0,0 +1,105 @@
+"""Inverted index with prefix matching and BM25 ranking for the glossary.
+
+Every glossary field is tokenized once when the index is built and each
+posting stores its precomputed BM25F impact, so a query only sums impacts
+from the posting lists of its (prefix-expanded) terms.
+"""
+import math
+import re
+from bisect import bisect_left
+
+# Relative importance of each glossary field when ranking.
+FIELD_WEIGHTS = {
+    "term": 3.0,
+    "definition": 1.0,
+    "consumer_impact": 1.0,
+    "what_to_ask": 0.5,
+    "category": 0.5,
+}
+
+K1 = 1.2
+B = 0.75
+
+# Score multiplier for a vocabulary word that only starts with a query token.
+PREFIX_WEIGHT = 0.6
+
+# Cap on how many vocabulary words a single prefix may expand to.
+MAX_PREFIX_EXPANSIONS = 50
+
+_WORD = re.compile(r"[a-z0-9]+")
+_QUOTES = str.maketrans({"‘": "'", "’": "'"})
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens ("Buyer's" -> "buyers")."""
+    return _WORD.findall(text.translate(_QUOTES).lower().replace("'", ""))
+
+
+class GlossaryIndex:
+    """Ranked full-text search over glossary entries."""
+
+    def __init__(self, glossary, fields=FIELD_WEIGHTS):
+        self._terms = list(glossary)
+        field_tokens = {
+            name: [tokenize(str(details.get(name, term) if name != "term" else term))
+                   for term, details in glossary.items()]
+            for name in fields
+        }
+        average_length = {
+            name: (sum(map(len, docs)) / len(docs) if docs else 0) or 1
+            for name, docs in field_tokens.items()
+        }
+
+        # BM25F: length-normalized, field-weighted term frequency per document.
+        frequencies = {}
+        for name, weight in fields.items():
+            for doc_id, tokens in enumerate(field_tokens[name]):
+                norm = 1 - B + B * len(tokens) / average_length[name]
+                for token in tokens:
+                    per_doc = frequencies.setdefault(token, {})
+                    per_doc[doc_id] = per_doc.get(doc_id, 0.0) + weight / norm
+
+        count = len(self._terms)
+        self._postings = {}
+        for token, per_doc in frequencies.items():
+            idf = math.log(1 + (count - len(per_doc) + 0.5) / (len(per_doc) + 0.5))
+            self._postings[token] = [
+                (doc_id, idf * tf * (K1 + 1) / (tf + K1)) for doc_id, tf in per_doc.items()
+            ]
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self):
+        return len(self._terms)
+
+    def _expand(self, token):
+        """Yield (vocabulary word, weight) pairs a query token matches."""
+        if token in self._postings:
+            yield token, 1.0
+        start = bisect_left(self._vocabulary, token)
+        expansions = 0
+        for word in self._vocabulary[start:]:
+            if not word.startswith(token) or expansions >= MAX_PREFIX_EXPANSIONS:
+                break
+            if word != token:
+                expansions += 1
+                yield word, PREFIX_WEIGHT
+
+    def search(self, query, limit=None):
+        """Return ``(term, score)`` pairs for ``query``, best match first.
+
+        Every query token also matches vocabulary words it is a prefix of, so
+        partially typed words ("insur") still find results.
+        """
+        scores = {}
+        for token in set(tokenize(query)):
+            best = {}
+            for word, weight in self._expand(token):
+                for doc_id, impact in self._postings[word]:
+                    if weight * impact > best.get(doc_id, 0.0):
+                        best[doc_id] = weight * impact
+            for doc_id, score in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self._terms[doc_id], round(score, 4)) for doc_id, score in ranked]
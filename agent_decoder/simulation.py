@@ -0,0 +1,86 @@
+"""Monte Carlo simulation of the cash a buyer needs at closing.
+
+Each fee is modelled as an independent, optional draw: it occurs with some
+probability and, when it does, its size is drawn uniformly or triangularly
+from a range given in dollars or as a percentage of the price. Every
+component is sampled for all scenarios at once with NumPy, and the generator
+is seedable so a given set of inputs always yields the same bands.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SCENARIOS = 100_000
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass(frozen=True)
+class FeeComponent:
+    low: float
+    high: float
+    mode: float = None
+    probability: float = 1.0
+    percent_of_price: bool = False
+
+    def sample(self, rng, price, size):
+        if self.mode is None or not self.low <= self.mode <= self.high or self.low == self.high:
+            draws = rng.uniform(self.low, self.high, size)
+        else:
+            draws = rng.triangular(self.low, self.mode, self.high, size)
+        if self.percent_of_price:
+            draws *= price / 100
+        if self.probability < 1:
+            draws *= rng.random(size) < self.probability
+        return draws
+
+
+# Ranges follow the glossary: closing costs of 2-5%, transaction fees of
+# $200-500 and buyer's premiums of $500-2,000 that often surprise buyers.
+DEFAULT_COMPONENTS = {
+    "Buyer's agent commission": FeeComponent(0.0, 3.0, mode=2.5, probability=0.5, percent_of_price=True),
+    "Transaction fee": FeeComponent(200, 500, probability=0.6),
+    "Buyer's premium": FeeComponent(500, 2000, probability=0.25),
+    "Title insurance": FeeComponent(0.5, 1.0, percent_of_price=True),
+    "Appraisal gap": FeeComponent(0.0, 5.0, mode=1.0, probability=0.2, percent_of_price=True),
+    "Lender and other closing costs": FeeComponent(1.5, 3.5, mode=2.0, percent_of_price=True),
+}
+
+
+@dataclass
+class SimulationResult:
+    price: float
+    down_payment: float
+    components: dict
+    totals: np.ndarray
+
+    def percentiles(self, levels=PERCENTILES):
+        """Total cash needed at closing at each percentile level."""
+        return pd.Series(np.percentile(self.totals, levels), index=[f"P{level}" for level in levels])
+
+    def component_summary(self):
+        """Per-fee chance of occurring, average cost and 95th percentile."""
+        return pd.DataFrame({
+            name: {
+                "chance": float(np.count_nonzero(draws)) / draws.size,
+                "average": float(draws.mean()),
+                "p95": float(np.percentile(draws, 95)),
+            }
+            for name, draws in self.components.items()
+        }).T
+
+    def histogram(self, bins=50):
+        counts, edges = np.histogram(self.totals, bins=bins)
+        return pd.DataFrame({"cash_needed": (edges[:-1] + edges[1:]) / 2, "scenarios": counts})
+
+
+def simulate_closing_costs(price, down_payment, components=None, scenarios=DEFAULT_SCENARIOS, seed=None):
+    """Draw ``scenarios`` outcomes of every fee and total the cash needed."""
+    rng = np.random.default_rng(seed)
+    components = DEFAULT_COMPONENTS if components is None else components
+    draws = {name: component.sample(rng, price, scenarios) for name, component in components.items()}
+    totals = np.full(scenarios, float(down_payment))
+    for values in draws.values():
+        totals += values
+    return SimulationResult(price, down_payment, draws, totals)
@@ -0,0 +1,159 @@
+"""Incremental tactic and realtor-speak tagging for conversation transcripts.
+
+A TranscriptAnalyzer is fed text as it arrives (pasted messages, an email
+thread read in chunks, a live chat) and yields one TaggedLine per completed
+line. Each line is tagged with psychology tactics, found through the
+tactics' trigger phrases, close paraphrases of their examples, the
+realtor-speak phrases linked to them and optionally the tactic classifier,
+and with the realtor-speak phrases it contains. Running counts are kept per
+tactic and per phrase, so appending more text only costs the new lines.
+"""
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from agent_decoder.matching import PhraseAutomaton, normalize
+
+# "Agent: ...", "Me - ...", "Sarah Lee: ..." at the start of a line.
+_SPEAKER = re.compile(r"^\s*([A-Za-z][\w .'-]{0,30}?)\s*[:\-]\s+(?=\S)")
+
+# Lines quoted from an earlier email ("> ...") are tagged but not counted again.
+_QUOTED = re.compile(r"^\s*(?:>\s?)+")
+
+FUZZY_THRESHOLD = 0.7
+
+
+@dataclass(frozen=True)
+class TaggedLine:
+    number: int
+    speaker: str
+    text: str
+    tactics: tuple
+    phrases: tuple
+    quoted: bool = False
+
+
+def build_transcript_patterns(psychology, realtor_speak):
+    """Compile tactic triggers and realtor-speak phrases into one automaton.
+
+    Each phrase maps to a list of ``("tactic", name)`` and
+    ``("realtor_speak", phrase)`` tags; a realtor-speak phrase also carries
+    the tactics that list it under ``realtor_speak``.
+    """
+    tags = {}
+
+    def add(phrase, tag):
+        tags.setdefault(normalize(phrase), []).append(tag)
+
+    for phrase in realtor_speak:
+        add(phrase, ("realtor_speak", phrase))
+    for tactic, details in psychology.items():
+        for phrase in details.get("triggers", ()):
+            add(phrase, ("tactic", tactic))
+        for phrase in details.get("realtor_speak", ()):
+            add(phrase, ("tactic", tactic))
+    return PhraseAutomaton(tags)
+
+
+def _linked_tactics(psychology):
+    links = {}
+    for tactic, details in psychology.items():
+        for phrase in details.get("realtor_speak", ()):
+            links.setdefault(phrase, []).append(tactic)
+    return links
+
+
+class TranscriptAnalyzer:
+    """Tag a transcript line by line as it is fed in.
+
+    ``patterns`` comes from build_transcript_patterns; ``phrase_index`` is
+    an optional fuzzy index from build_phrase_index that also catches
+    misspelled or reworded tactic examples and realtor-speak, and
+    ``classifier`` an optional TacticClassifier for tactics worded in ways
+    neither of those know.
+    """
+
+    def __init__(self, patterns, psychology, phrase_index=None, classifier=None, fuzzy_threshold=FUZZY_THRESHOLD):
+        self.patterns = patterns
+        self.phrase_index = phrase_index
+        self.classifier = classifier
+        self.fuzzy_threshold = fuzzy_threshold
+        self._links = _linked_tactics(psychology)
+        self.tactic_counts = Counter()
+        self.phrase_counts = Counter()
+        self.lines = []
+        self.characters = 0
+        self._partial = ""
+
+    @property
+    def pending(self):
+        """Text after the last newline, not yet tagged or counted."""
+        return self._partial
+
+    def tag(self, text, number=0):
+        """Tag one line without touching the running counts."""
+        speaker = ""
+        quoted = _QUOTED.match(text)
+        body = text[quoted.end():] if quoted else text
+        match = _SPEAKER.match(body)
+        if match:
+            speaker, body = match.group(1).strip(), body[match.end():]
+        tactics, phrases = [], []
+        for found in self.patterns.iter_matches(body):
+            for kind, name in found.value:
+                (tactics if kind == "tactic" else phrases).append(name)
+        if self.phrase_index is not None:
+            for found in self.phrase_index.search(body, self.fuzzy_threshold):
+                source, key, _ = found.value
+                if source == "psychology":
+                    tactics.append(key)
+                else:
+                    phrases.append(key)
+                    tactics.extend(self._links.get(key, ()))
+        if self.classifier is not None:
+            prediction = self.classifier.predict(body)
+            if prediction.is_tactic:
+                tactics.append(prediction.label)
+        return TaggedLine(
+            number, speaker, body.strip(),
+            tuple(dict.fromkeys(tactics)), tuple(dict.fromkeys(phrases)),
+            quoted is not None,
+        )
+
+    def feed(self, text):
+        """Add text and yield a TaggedLine for every line it completes.
+
+        A trailing line without a newline is held back until more text
+        arrives or flush() is called.
+        """
+        self.characters += len(text)
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            tagged = self._record(line)
+            if tagged is not None:
+                yield tagged
+
+    def flush(self):
+        """Tag and count any held-back final line."""
+        line, self._partial = self._partial, ""
+        tagged = self._record(line)
+        return [tagged] if tagged is not None else []
+
+    def _record(self, line):
+        if not line.strip():
+            return None
+        tagged = self.tag(line, len(self.lines) + 1)
+        self.lines.append(tagged)
+        if not tagged.quoted:
+            self.tactic_counts.update(tagged.tactics)
+            self.phrase_counts.update(tagged.phrases)
+        return tagged
+
+
+def analyze_transcript(chunks, patterns, psychology, phrase_index=None, classifier=None):
+    """Generate TaggedLines from an iterable of text chunks."""
+    analyzer = TranscriptAnalyzer(patterns, psychology, phrase_index, classifier)
+    for chunk in chunks:
+        yield from analyzer.feed(chunk)
+    yield from analyzer.flush()
@@ -0,0 +1,5 @@
+"""One module per sidebar tool, each exposing ``render()``.
+
+app.py imports a page module the first time its tool is selected, so a cold
+start only pays for the page being shown.
+"""
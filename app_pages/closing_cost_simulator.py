@@ -0,0 +1,98 @@
+"""Closing Cost Simulator page."""
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from agent_decoder.simulation import DEFAULT_COMPONENTS, FeeComponent, simulate_closing_costs
+
+PERCENT_UNIT = "% of price"
+DOLLAR_UNIT = "$"
+
+SCENARIO_COUNTS = [10_000, 100_000, 250_000, 500_000]
+
+
+def default_fee_table():
+    return pd.DataFrame([
+        {
+            "Fee": name,
+            "Chance (%)": component.probability * 100,
+            "Low": component.low,
+            "Most Likely": component.mode,
+            "High": component.high,
+            "Unit": PERCENT_UNIT if component.percent_of_price else DOLLAR_UNIT,
+        }
+        for name, component in DEFAULT_COMPONENTS.items()
+    ])
+
+
+def render():
+    st.markdown('<h2 class="section-header">🎲 Closing Cost Simulator</h2>', unsafe_allow_html=True)
+    st.write("Closing costs are uncertain - surprise fees, low appraisals and commission you may owe can all show up late. "
+             "This simulates thousands of possible closings to show how much cash you should really plan for.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        home_price = st.number_input("Home Price ($)", min_value=10000, value=300000, step=5000)
+        down_payment_pct = st.slider("Down Payment (%)", 0.0, 50.0, 10.0, 0.5)
+    
+    with col2:
+        scenarios = st.select_slider("Scenarios to Simulate", options=SCENARIO_COUNTS, value=100_000, format_func=lambda n: f"{n:,}")
+        seed = st.number_input("Random Seed", min_value=0, value=42, step=1, help="The same seed always gives the same results.")
+    
+    st.markdown("### 🧾 Fee Assumptions")
+    fee_table = st.data_editor(
+        default_fee_table(),
+        num_rows="dynamic",
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Unit": st.column_config.SelectboxColumn(options=[PERCENT_UNIT, DOLLAR_UNIT], required=True)},
+    ).dropna(subset=["Fee", "Low", "High"])
+    
+    components = {
+        str(row["Fee"]): FeeComponent(
+            low=float(min(row["Low"], row["High"])),
+            high=float(max(row["Low"], row["High"])),
+            mode=None if pd.isna(row["Most Likely"]) else float(row["Most Likely"]),
+            probability=min(max(float(row["Chance (%)"] if pd.notna(row["Chance (%)"]) else 100) / 100, 0.0), 1.0),
+            percent_of_price=row["Unit"] == PERCENT_UNIT,
+        )
+        for _, row in fee_table.iterrows()
+    }
+    
+    down_payment = home_price * down_payment_pct / 100
+    result = simulate_closing_costs(home_price, down_payment, components, scenarios, int(seed))
+    bands = result.percentiles()
+    
+    st.markdown("### 💵 Cash Needed at Closing")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Typical (median)", f"${bands['P50']:,.0f}")
+    col2.metric("Likely Range (P25-P75)", f"${bands['P25']:,.0f} - ${bands['P75']:,.0f}")
+    col3.metric("Plan For (P95)", f"${bands['P95']:,.0f}")
+    
+    st.markdown(f'<div class="warning-box"><strong>Plan for the high end:</strong> In 1 out of 20 simulated closings you would need more than <strong>${bands["P95"]:,.0f}</strong> - '
+                f'${bands["P95"] - down_payment:,.0f} on top of your ${down_payment:,.0f} down payment.</div>', unsafe_allow_html=True)
+    
+    histogram = alt.Chart(result.histogram()).mark_bar().encode(
+        x=alt.X("cash_needed:Q", title="Cash Needed at Closing ($)", axis=alt.Axis(format="$,.0f")),
+        y=alt.Y("scenarios:Q", title="Scenarios"),
+        tooltip=[alt.Tooltip("cash_needed:Q", format="$,.0f"), "scenarios:Q"],
+    )
+    st.altair_chart(histogram, use_container_width=True)
+    
+    st.markdown("### 🔍 Where the Money Goes")
+    if components:
+        summary = result.component_summary()
+        st.dataframe(pd.DataFrame({
+            "Chance": summary["chance"].map("{:.0%}".format),
+            "Average Cost": summary["average"].map("${:,.0f}".format),
+            "Bad Case (P95)": summary["p95"].map("${:,.0f}".format),
+        }), use_container_width=True)
+    else:
+        st.info("Add at least one fee with a Low and High amount to see where the money goes.")
+    
+    st.markdown("### 🛡️ How to Shrink the Tail")
+    st.write("• Ask for an itemized fee list before you make an offer")
+    st.write("• Get it in writing whether a buyer's premium or transaction fee applies")
+    st.write("• Shop title insurance - you can usually choose your own company")
+    st.write("• Keep an appraisal contingency so a low appraisal doesn't come out of your pocket")
@@ -0,0 +1,144 @@
+"""Commission Calculator page."""
+import tempfile
+
+import altair as alt
+import numpy as np
+import streamlit as st
+
+from agent_decoder.audit import AuditError, audit_transactions
+from agent_decoder.commission import ABOVE_AVERAGE_RATE, BELOW_AVERAGE_RATE, scenario_matrix
+from agent_decoder.core import compute_commission
+
+# Heatmap cells per axis; larger grids are sampled down before charting.
+HEATMAP_CELLS = 50
+
+RATE_SCALE_OPTIONS = {
+    "Detect automatically": "auto",
+    "Percentages (6 = 6%)": "percent",
+    "Fractions (0.06 = 6%)": "fraction",
+}
+
+GRID_SIZES = {"100 × 20": (100, 20), "500 × 50": (500, 50), "1000 × 100": (1000, 100)}
+
+
+def render():
+    st.markdown('<h2 class="section-header">💰 Commission Calculator</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Calculate Real Estate Commissions")
+        home_price = st.number_input("Home Sale Price ($)", value=300000, step=5000)
+        total_commission = st.slider("Total Commission Rate (%)", 4.0, 8.0, 6.0, 0.1)
+        
+        # Calculate commissions
+        breakdown = compute_commission(home_price, total_commission)
+        
+    with col2:
+        st.markdown("### 💡 Commission Breakdown")
+        st.metric("Total Commission", f"${breakdown.total_commission:,.0f}")
+        st.metric("Listing Agent Gets", f"${breakdown.listing_agent:,.0f}")
+        st.metric("Buying Agent Gets", f"${breakdown.buying_agent:,.0f}")
+        
+        if breakdown.assessment == "above":
+            st.error("⚠️ This commission rate is above average (typically 5-6%)")
+        elif breakdown.assessment == "below":
+            st.warning("This rate may indicate limited services")
+        else:
+            st.success("✅ This rate is within normal range")
+    
+    st.markdown("### 🧮 Alternative Fee Structures")
+    st.write("**Flat Fee:** Some agents charge $3,000-$5,000 regardless of home price")
+    st.write("**Reduced Commission:** Negotiable, especially on higher-priced homes")
+    st.write("**For Sale By Owner:** $0 agent commission, but you handle everything")
+    
+    # Commission impact calculator
+    st.markdown("### 💰 Commission Impact on Your Purchase")
+    st.write(f"**Remember:** The seller pays commission, but it's built into the home price.")
+    st.write(f"**Your real cost:** Commission is factored into what you pay for the home.")
+    st.write(f"**Negotiation opportunity:** In a buyer's market, you may be able to negotiate commission into the price.")
+    
+    # Scenario explorer
+    st.markdown("### 📊 Scenario Explorer")
+    st.write("See what agents collect across a whole range of prices and rates, including flat and brokerage fees.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        price_range = st.slider("Home Price Range ($)", 50000, 3000000, (200000, 800000), 10000)
+        rate_range = st.slider("Commission Rate Range (%)", 0.0, 10.0, (4.0, 7.0), 0.1)
+        listing_split = st.slider("Listing Agent Share of Commission (%)", 0, 100, 50, 5)
+    
+    with col2:
+        flat_fee = st.number_input("Flat Fee to Listing Agent ($)", min_value=0, value=0, step=500)
+        transaction_fee = st.number_input("Brokerage Transaction Fee ($)", min_value=0, value=395, step=25)
+        grid_size = st.select_slider("Grid Size (prices × rates)", options=list(GRID_SIZES), value="100 × 20")
+    
+    price_steps, rate_steps = GRID_SIZES[grid_size]
+    matrix = scenario_matrix(
+        np.linspace(*price_range, price_steps),
+        np.linspace(*rate_range, rate_steps),
+        split=listing_split / 100,
+        flat_fee=flat_fee,
+        transaction_fee=transaction_fee,
+    )
+    
+    sample = matrix.iloc[::max(1, price_steps // HEATMAP_CELLS), ::max(1, rate_steps // HEATMAP_CELLS)]
+    heatmap = alt.Chart(sample.stack().rename("total_cost").reset_index()).mark_rect().encode(
+        x=alt.X("rate:Q", bin=alt.Bin(maxbins=HEATMAP_CELLS), title="Commission Rate (%)"),
+        y=alt.Y("price:Q", bin=alt.Bin(maxbins=HEATMAP_CELLS), title="Home Price ($)", axis=alt.Axis(format="$,.0f")),
+        color=alt.Color("mean(total_cost):Q", title="Total Agent Cost ($)", scale=alt.Scale(scheme="orangered")),
+        tooltip=[alt.Tooltip("mean(total_cost):Q", title="Total Agent Cost", format="$,.0f")],
+    )
+    st.altair_chart(heatmap, use_container_width=True)
+    
+    low, high = matrix.values.min(), matrix.values.max()
+    st.write(f"**Across {matrix.size:,} scenarios** agents collect between ${low:,.0f} and ${high:,.0f}.")
+    # The full table is up to 100,000 cells, so it is only sent when asked for
+    if st.toggle("📋 Show full scenario table"):
+        st.dataframe(matrix.round(0), use_container_width=True)
+    
+    # Bulk audit
+    st.markdown("### 📦 Bulk Commission Audit")
+    st.write(f"Upload closed transactions to flag every deal above {ABOVE_AVERAGE_RATE}% or below {BELOW_AVERAGE_RATE}% commission.")
+    st.caption("Needs `price` and `commission_rate` columns; optional `listing_split`, `flat_fee` and `transaction_fee` (or `fees`).")
+    
+    transactions_file = st.file_uploader("Upload Transactions (CSV or Parquet)", type=['csv', 'parquet'])
+    flagged_only = st.checkbox("Only include flagged deals in the download", value=True)
+    rate_scale = st.selectbox("Commission rates in the file are written as", list(RATE_SCALE_OPTIONS))
+    
+    if transactions_file:
+        progress_text = st.empty()
+        with tempfile.TemporaryFile("w+", suffix=".csv") as results:
+            try:
+                summary = audit_transactions(
+                    transactions_file, results, transactions_file.name, flagged_only=flagged_only,
+                    progress=lambda rows: progress_text.caption(f"Audited {rows:,} transactions..."),
+                    rate_scale=RATE_SCALE_OPTIONS[rate_scale],
+                )
+            except AuditError as e:
+                st.error(f"Could not audit this file: {e}")
+                summary = None
+            progress_text.empty()
+            
+            if summary is not None:
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Transactions", f"{summary.rows:,}")
+                col2.metric("Above Average", f"{summary.above:,}")
+                col3.metric("Below Average", f"{summary.below:,}")
+                col4.metric("Average Effective Rate", f"{summary.average_effective_rate:.2f}%")
+                
+                if summary.invalid:
+                    st.warning(f"{summary.invalid:,} rows had a missing or non-numeric price or rate.")
+                if summary.flagged:
+                    st.error(f"⚠️ {summary.flagged:,} deals fall outside the typical {BELOW_AVERAGE_RATE}-{ABOVE_AVERAGE_RATE}% range")
+                else:
+                    st.success("✅ Every deal is within the normal range")
+                
+                results.seek(0)
+                st.download_button(
+                    "⬇️ Download Audit Results",
+                    results.read(),
+                    file_name=f"{transactions_file.name.rsplit('.', 1)[0]}_audit.csv",
+                    mime="text/csv",
+                )
@@ -0,0 +1,81 @@
+"""Conflict Checker page."""
+import streamlit as st
+
+STATE_KEY = "conflict_checker"
+
+CONFLICTS = [
+    "Agent represents both buyer and seller (dual agency)",
+    "Agent receives kickbacks from recommended lenders",
+    "Agent owns or has interest in the property",
+    "Agent is related to the seller",
+    "Agent gets higher commission from certain lenders",
+    "Agent pushes specific properties they have listings on",
+    "Agent discourages you from shopping around for services",
+    "Agent has relationships with inspectors/appraisers",
+    "Agent won't disclose their compensation structure",
+    "Agent pressures you to use their title company"
+]
+
+WHAT_THIS_MEANS = """### ⚖️ What This Means
+• Your agent may prioritize their interests over yours  
+• You may not be getting the best deal available  
+• Consider getting independent advice  
+• Ask for written disclosure of all relationships  
+• You have the right to separate representation"""
+
+
+def detected_conflicts():
+    """Conflicts checked so far, kept across reruns."""
+    if STATE_KEY not in st.session_state:
+        st.session_state[STATE_KEY] = set()
+    return st.session_state[STATE_KEY]
+
+
+def checkbox_key(conflict):
+    return f"{STATE_KEY}::{conflict}"
+
+
+def toggle_conflict(conflict):
+    if st.session_state[checkbox_key(conflict)]:
+        detected_conflicts().add(conflict)
+    else:
+        detected_conflicts().discard(conflict)
+
+
+@st.fragment
+def checklist():
+    """Checkboxes and summary; toggling a conflict reruns only this panel."""
+    detected = detected_conflicts()
+    for conflict in CONFLICTS:
+        key = checkbox_key(conflict)
+        if key not in st.session_state:
+            st.session_state[key] = conflict in detected
+        st.checkbox(conflict, key=key, on_change=toggle_conflict, args=(conflict,))
+    
+    if detected:
+        st.markdown(f'<div class="danger-box"><strong>🚨 {len(detected)} Potential Conflicts Detected!</strong><br>These conflicts may not be illegal, but they could affect the advice you receive.</div>', unsafe_allow_html=True)
+        st.markdown(WHAT_THIS_MEANS)
+    else:
+        st.success("✅ No obvious conflicts detected. Stay vigilant!")
+
+
+def render():
+    st.markdown('<h2 class="section-header">⚠️ Conflict Checker</h2>', unsafe_allow_html=True)
+    st.write("Identify potential conflicts of interest with your real estate agent.")
+    
+    st.markdown("### 🔍 Check for These Conflicts")
+    
+    checklist()
+    
+    st.markdown("### 📋 Questions to Ask About Conflicts")
+    conflict_questions = [
+        "Do you represent both buyers and sellers?",
+        "What compensation do you receive from lenders, title companies, or inspectors?",
+        "Do you have any financial interest in properties you're showing me?",
+        "How does your commission change based on the price or lender I choose?",
+        "Are you related to or friends with the seller?",
+        "Do you get bonuses for using certain service providers?"
+    ]
+    
+    for question in conflict_questions:
+        st.write(f"• {question}")
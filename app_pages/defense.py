@@ -0,0 +1,82 @@
+"""Defense page."""
+import streamlit as st
+
+ALWAYS_DO = [
+    "Take time to think (at least 24 hours)",
+    "Get everything in writing",
+    "Compare at least 3 options",
+    "Bring a knowledgeable friend",
+    "Research comparable sales yourself",
+    "Ask 'How does this benefit you?'",
+    "Verify all information independently",
+    "Set your maximum budget privately",
+]
+
+NEVER_DO = [
+    "Sign anything the same day",
+    "Accept verbal promises",
+    "Let emotions drive decisions",
+    "Work with agents who pressure you",
+    "Skip due diligence steps",
+    "Assume their interests align with yours",
+    "Give full financial details upfront",
+    "Waive inspections or contingencies",
+]
+
+# Each column is sent as one Markdown element rather than one per bullet
+ALWAYS_DO_MARKDOWN = "#### ✅ Always Do\n\n" + "  \n".join(f"• {rule}" for rule in ALWAYS_DO)
+NEVER_DO_MARKDOWN = "#### 🚫 Never Do\n\n" + "  \n".join(f"• {rule}" for rule in NEVER_DO)
+
+
+def render():
+    st.markdown('<h2 class="section-header">🎯 Defense Strategies</h2>', unsafe_allow_html=True)
+    
+    st.markdown("### 🛡️ Defense Against Common Tactics")
+    
+    defense_strategies = {
+        "When they say 'Act Now'": {
+            "Response": "I need time to think about this decision. When is the actual deadline?",
+            "Why it works": "Forces them to be specific and removes false urgency"
+        },
+        "When they push their lender": {
+            "Response": "I'll need to compare rates from multiple lenders before deciding.",
+            "Why it works": "Shows you're informed and won't be rushed into expensive financing"
+        },
+        "When they discourage inspections": {
+            "Response": "I'm not comfortable waiving inspections. What are you worried we might find?",
+            "Why it works": "Makes them explain their real concerns"
+        },
+        "When they say 'Trust me'": {
+            "Response": "I appreciate your advice. Can you put that recommendation in writing?",
+            "Why it works": "Professionals should stand behind their advice"
+        },
+        "When they push higher offers": {
+            "Response": "What's the lowest offer you think might be accepted?",
+            "Why it works": "Gets them thinking about realistic negotiation range"
+        },
+        "When they create urgency": {
+            "Response": "If this is really the right house for me, I'll still want it tomorrow.",
+            "Why it works": "Shows you won't be rushed and tests their claims"
+        },
+        "When they mention 'other interested buyers'": {
+            "Response": "Can you show me written proof of other offers?",
+            "Why it works": "Most agents can't prove this claim because it's often false"
+        },
+        "When they get defensive about questions": {
+            "Response": "I'm just trying to make an informed decision. Can you help me understand?",
+            "Why it works": "Professional agents should welcome questions, not resist them"
+        }
+    }
+    
+    for situation, defense in defense_strategies.items():
+        with st.expander(situation):
+            st.markdown(f"**Say this:** '{defense['Response']}'\n\n**Why it works:** {defense['Why it works']}")
+    
+    st.markdown("### 📝 Universal Defense Rules")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(ALWAYS_DO_MARKDOWN)
+    
+    with col2:
+        st.markdown(NEVER_DO_MARKDOWN)
@@ -0,0 +1,175 @@
+"""Document Analysis page."""
+import html
+
+import streamlit as st
+
+from agent_decoder.core import analyze_upload, compare_uploads
+from agent_decoder.documents import DocumentError
+from agent_decoder.fees import fee_table
+
+UPLOAD_TYPES = ['pdf', 'txt', 'docx']
+
+CHANGE_LABELS = {"modified": "✏️ Reworded", "added": "➕ Added", "removed": "➖ Removed"}
+
+
+def render():
+    st.markdown('<h2 class="section-header">📄 Document Analysis</h2>', unsafe_allow_html=True)
+    mode = st.radio("Mode", ["📄 Single Document", "🔀 Compare Two Revisions"], horizontal=True)
+    if mode == "🔀 Compare Two Revisions":
+        render_comparison()
+    else:
+        render_single()
+
+
+def render_single():
+    st.write("Upload your real estate documents to identify hidden fees and problematic clauses.")
+    
+    uploaded_file = st.file_uploader(
+        "Upload Document (PDF, TXT, DOCX)",
+        type=UPLOAD_TYPES,
+        help="Upload listing agreements, purchase contracts, disclosure forms, or any real estate document"
+    )
+    
+    if uploaded_file:
+        progress_bar = st.progress(0.0, text="Reading document...")
+        
+        def show_progress(done, total):
+            progress_bar.progress(done / total, text=f"Scanned {done} of {total} pages")
+        
+        try:
+            report, cached = analyze_upload(uploaded_file, progress=show_progress)
+        except DocumentError as e:
+            st.error(f"Could not analyze this document: {e}")
+            report = None
+        progress_bar.empty()
+        
+        if report is not None:
+            st.success(f"Scanned {report.segments} {report.unit}(s), {report.characters:,} characters.")
+            if cached:
+                st.caption("⚡ Same file as an earlier upload - showing the saved analysis.")
+            
+            st.markdown("### 🔍 Analysis Results")
+            severity_counts = report.severity_counts()
+            metric_cols = st.columns(len(severity_counts))
+            for metric_col, (severity, count) in zip(metric_cols, severity_counts.items()):
+                metric_col.metric(f"{severity} Findings", count)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### ⚠️ Potential Issues Found")
+                red_flag_findings = report.by_source("red_flag")
+                if red_flag_findings:
+                    seen = set()
+                    for finding in red_flag_findings:
+                        if finding.key not in seen:
+                            seen.add(finding.key)
+                            st.write(f"• **{finding.key}** ({finding.severity}) - \"{finding.matched}\" in {report.unit} {finding.segment}")
+                else:
+                    st.write("• No red-flag language detected")
+            
+            with col2:
+                st.markdown("#### 📖 Terms and Phrases to Review")
+                term_findings = report.by_source("glossary") + report.by_source("realtor_speak")
+                if term_findings:
+                    seen = set()
+                    for finding in term_findings:
+                        if finding.key not in seen:
+                            seen.add(finding.key)
+                            st.write(f"• **{finding.key}** - first seen in {report.unit} {finding.segment}")
+                else:
+                    st.write("• No glossary terms or realtor-speak found")
+            
+            render_fees(report.amounts, report.unit)
+            
+            if report.findings:
+                # pandas costs ~0.5 s to import, so only pay for it when there is a table to show
+                import pandas as pd
+                
+                st.markdown("### 📋 All Findings")
+                st.dataframe(pd.DataFrame([{
+                    "Severity": f.severity,
+                    "Source": f.source.replace("_", " ").title(),
+                    "Entry": f.key,
+                    "Matched Text": f.matched,
+                    report.unit.title(): f.segment,
+                    "Offset": f.offset,
+                    "Context": f.context,
+                } for f in report.findings]), use_container_width=True, hide_index=True)
+
+
+def render_fees(amounts, unit):
+    st.markdown("### 💵 Fees and Amounts")
+    fees = [amount for amount in amounts if amount.label]
+    if not fees:
+        st.write("• No labelled fees or charges found")
+        return
+    
+    table = fee_table(fees)
+    low, high = table["Low ($)"].iloc[-1], table["High ($)"].iloc[-1]
+    col1, col2 = st.columns(2)
+    col1.metric("Dollar Fees Found", f"${low:,.0f}" if low == high else f"${low:,.0f} - ${high:,.0f}")
+    col2.metric("Fee Mentions", len(fees))
+    st.dataframe(table, use_container_width=True, hide_index=True, column_config={
+        "Low ($)": st.column_config.NumberColumn(format="$%.2f"),
+        "High ($)": st.column_config.NumberColumn(format="$%.2f"),
+    })
+    with st.expander(f"Every amount found ({len(amounts)})"):
+        st.dataframe([{
+            "Amount": amount.matched,
+            "Label": amount.label,
+            "Glossary Term": amount.term,
+            unit.title(): amount.segment,
+        } for amount in amounts], use_container_width=True, hide_index=True)
+
+
+def clause_markdown(clauses, box):
+    text = "<br>".join(html.escape(clause.text) for clause in clauses)
+    return f'<div class="{box}">{text}</div>'
+
+
+def render_comparison():
+    st.write("Upload the version you were first sent and the revised one to see exactly which clauses changed - and whether the edits added or removed red flags.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        old_file = st.file_uploader("Original version", type=UPLOAD_TYPES, key="revision_old")
+    with col2:
+        new_file = st.file_uploader("Revised version", type=UPLOAD_TYPES, key="revision_new")
+    
+    if not (old_file and new_file):
+        return
+    try:
+        diff = compare_uploads(old_file, new_file)
+    except DocumentError as e:
+        st.error(f"Could not compare these documents: {e}")
+        return
+    
+    metric_cols = st.columns(4)
+    metric_cols[0].metric("Pages/Sections Changed", f"{diff.changed_segments} of {max(diff.old_segments, diff.new_segments)}")
+    metric_cols[1].metric("Clause Changes", len(diff.changes))
+    metric_cols[2].metric("New Findings", len(diff.added_findings))
+    metric_cols[3].metric("Findings Removed", len(diff.removed_findings))
+    
+    if not diff.changes:
+        st.success("✅ No wording changes - the two versions say the same thing.")
+        return
+    
+    if diff.added_findings:
+        flagged = ", ".join(sorted({
+            f"<strong>{html.escape(f.key)}</strong> ({html.escape(f.severity)})" for f in diff.added_findings
+        }))
+        st.markdown(f'<div class="danger-box"><strong>🚨 The revision introduces language to review:</strong> {flagged}</div>', unsafe_allow_html=True)
+    
+    st.markdown("### 🔀 What Changed")
+    for change in diff.changes:
+        clauses = change.new or change.old
+        st.markdown(f"#### {CHANGE_LABELS[change.kind]} - section {clauses[0].segment}")
+        if change.old:
+            st.markdown(clause_markdown(change.old, "danger-box" if change.kind == "removed" else "warning-box"), unsafe_allow_html=True)
+        if change.new:
+            st.markdown(clause_markdown(change.new, "success-box"), unsafe_allow_html=True)
+        for finding in change.added_findings:
+            st.write(f"• 🚨 Adds **{finding.key}** ({finding.severity}) - \"{finding.matched}\"")
+        for finding in change.removed_findings:
+            st.write(f"• ✅ Removes **{finding.key}** ({finding.severity})")
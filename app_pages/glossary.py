@@ -0,0 +1,65 @@
+"""Glossary page."""
+import streamlit as st
+
+from agent_decoder import data
+from agent_decoder.core import search_glossary
+
+
+# Browsing tabs: (label, category, expander icon)
+CATEGORY_TABS = [
+    ("💰 Financial", "Financial", "💰"),
+    ("🏠 Property", "Property", "🏠"),
+    ("📈 Market", "Market", "📈"),
+    ("📋 Legal", "Legal", "📋"),
+]
+
+# Search results spell out every red flag level and negotiability; browsing stays brief
+SEARCH_ALERTS = {"High": ("danger-box", "🚨 HIGH RED FLAG: "), "Medium": ("warning-box", "⚠️ WATCH OUT: "), "Low": ("info-box", "💡 GOOD TO KNOW: ")}
+BROWSE_ALERTS = {"High": ("danger-box", "🚨 "), "Medium": ("warning-box", "⚠️ ")}
+
+
+@st.cache_data
+def term_markdown(term, data_version, search_result=False):
+    """One term's expander body as a single Markdown/HTML string."""
+    details = data.glossary()[term]
+    parts = [
+        f"**Definition:** {details['definition']}".replace("$", "\\$"),
+        f'<div class="info-box"><strong>Impact on You:</strong> {details["consumer_impact"]}</div>',
+    ]
+    alert = (SEARCH_ALERTS if search_result else BROWSE_ALERTS).get(details['red_flag_level'])
+    if alert:
+        parts.append(f'<div class="{alert[0]}">{alert[1]}{details["what_to_ask"]}</div>')
+    if details['negotiable']:
+        parts.append(f'<div class="success-box">✅ {"This is often negotiable!" if search_result else "Often negotiable!"}</div>')
+    elif search_result:
+        parts.append('<div class="info-box">ℹ️ This is typically non-negotiable</div>')
+    return "\n\n".join(parts)
+
+
+def render():
+    st.markdown('<h2 class="section-header">📚 Real Estate Glossary</h2>', unsafe_allow_html=True)
+    glossary_database = data.glossary()
+    
+    # Search functionality
+    search_term = st.text_input("🔍 Search for a term:")
+    
+    if search_term:
+        # Ranked results from the prebuilt index, best match first
+        results = search_glossary(search_term)
+        
+        if results:
+            for term, _ in results:
+                with st.expander(f"📖 {term}"):
+                    st.markdown(term_markdown(term, glossary_database.version, search_result=True), unsafe_allow_html=True)
+        else:
+            st.info("No matching terms found. Try a different search or browse categories below.")
+    else:
+        # Category tabs
+        terms_by_category = glossary_database.by("category")
+        tabs = st.tabs([label for label, _, _ in CATEGORY_TABS])
+        
+        for tab, (_, category, icon) in zip(tabs, CATEGORY_TABS):
+            with tab:
+                for term in terms_by_category.get(category, {}):
+                    with st.expander(f"{icon} {term}"):
+                        st.markdown(term_markdown(term, glossary_database.version), unsafe_allow_html=True)
@@ -0,0 +1,160 @@
+"""Meeting Prep Tool page."""
+import streamlit as st
+
+# meeting type -> sections of (heading, optional lead-in, bullet points)
+MEETING_GUIDES = {
+    "First meeting with agent": [
+        ("### 🎯 Essential Questions to Ask", None, [
+            "What is your commission rate and is it negotiable?",
+            "Do you ever represent both buyers and sellers?",
+            "How many homes have you sold in the last 12 months?",
+            "What services do you provide for your commission?",
+            "Can you provide references from recent clients?",
+            "What is your strategy for finding/selling homes?",
+            "How do you handle multiple offers?",
+            "What other compensation do you receive in this transaction?",
+            "Can you show me your license and any complaints against you?",
+            "What happens if I'm not satisfied with your services?",
+        ]),
+        ("### 🚨 Red Flags in First Meeting", None, [
+            "Won't answer commission questions directly",
+            "Pressures you to sign exclusive agreement immediately",
+            "Can't provide recent client references",
+            "Gets defensive about dual agency questions",
+            "Won't show you their credentials",
+        ]),
+    ],
+    "Property viewing": [
+        ("### 🔍 What to Look For", "**Red Flags:**", [
+            "Agent rushes you through the property",
+            "Discourages questions about problems",
+            "Pushes you to make immediate decisions",
+            "Won't let you take photos or measurements",
+            "Avoids showing you certain areas",
+        ]),
+        ("### ❓ Important Questions", None, [
+            "How long has this been on the market?",
+            "Why is the seller moving?",
+            "What repairs or issues are known?",
+            "What would you offer if you were buying?",
+            "Are there any upcoming assessments or HOA changes?",
+            "What were the results of the last inspection?",
+            "Have there been any price reductions?",
+        ]),
+    ],
+    "Making an offer": [
+        ("### 💰 Negotiation Strategy", "**Before the meeting:**", [
+            "Research comparable sales yourself",
+            "Set your maximum budget (don't tell the agent)",
+            "Decide on contingencies you want",
+            "Prepare to walk away",
+            "Get pre-approved by multiple lenders",
+        ]),
+        ("### 🎯 Key Questions", None, [
+            "What's the lowest offer you think they'd accept?",
+            "How many other offers are there really?",
+            "What contingencies would you recommend?",
+            "How will you present our offer to stand out?",
+            "What are comparable homes selling for?",
+            "What's your commission if we offer less?",
+        ]),
+    ],
+    "Negotiation": [
+        ("### 🤝 Negotiation Preparation", "**Your Position:**", [
+            "Know your walk-away price",
+            "Have financing pre-approved",
+            "Research market conditions",
+            "Identify property weaknesses",
+            "Understand seller's motivation",
+        ]),
+        ("### 💪 Negotiation Questions", None, [
+            "What motivated this counteroffer?",
+            "Which terms are most important to the seller?",
+            "What happens if we can't reach agreement?",
+            "Are there other interested parties?",
+            "What's the seller's timeline?",
+        ]),
+    ],
+    "Contract review": [
+        ("### 📋 Contract Review Checklist", "**Must Review:**", [
+            "All financial terms and deadlines",
+            "Contingency clauses",
+            "Who pays which fees",
+            "Repair responsibilities",
+            "Closing date and possession",
+            "Commission disclosure",
+        ]),
+        ("### ⚠️ Watch Out For", None, [
+            "Blank spaces to be filled later",
+            "Unusual or excessive fees",
+            "Limited contingency periods",
+            "Automatic renewal clauses",
+            "Dual agency disclosures",
+        ]),
+    ],
+    "Closing preparation": [
+        ("### 🏁 Closing Preparation", "**Bring to Closing:**", [
+            "Government-issued photo ID",
+            "Certified funds for closing costs",
+            "Homeowner's insurance proof",
+            "Final walk-through notes",
+            "Copy of purchase agreement",
+        ]),
+        ("### 🔍 Final Questions", None, [
+            "Are all agreed-upon repairs completed?",
+            "Are all utilities transferred?",
+            "When do I get the keys?",
+            "What happens if there are last-minute issues?",
+            "Are all fees exactly as estimated?",
+        ]),
+    ],
+}
+
+ALWAYS_BRING = [
+    "Written list of questions",
+    "Calculator for quick math",
+    "Notebook for taking notes",
+    "Relevant documents",
+    "A trusted advisor/friend",
+    "Voice recorder (if legal in your state)",
+]
+
+NEVER_DO = [
+    "Sign anything same day",
+    "Give access to all your finances",
+    "Agree to exclusivity immediately",
+    "Accept verbal agreements only",
+    "Make decisions under pressure",
+    "Let emotions override logic",
+]
+
+
+def section_markdown(heading, lead_in, items):
+    bullets = "  \n".join(f"• {item}" for item in items)
+    return f"{heading}\n\n{lead_in}  \n{bullets}" if lead_in else f"{heading}\n\n{bullets}"
+
+
+# Each guide and tip column is sent as one Markdown element rather than one per line
+GUIDE_MARKDOWN = {
+    meeting_type: "\n\n".join(section_markdown(*section) for section in sections)
+    for meeting_type, sections in MEETING_GUIDES.items()
+}
+ALWAYS_BRING_MARKDOWN = section_markdown("#### ✅ Always Bring", None, ALWAYS_BRING)
+NEVER_DO_MARKDOWN = section_markdown("#### 🚫 Never Do", None, NEVER_DO)
+
+
+def render():
+    st.markdown('<h2 class="section-header">📝 Meeting Prep Tool</h2>', unsafe_allow_html=True)
+    
+    meeting_type = st.selectbox("What type of meeting are you preparing for?", list(MEETING_GUIDES))
+    st.markdown(GUIDE_MARKDOWN[meeting_type])
+    
+    st.markdown("### 📋 Universal Meeting Tips")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(ALWAYS_BRING_MARKDOWN)
+    
+    with col2:
+        st.markdown(NEVER_DO_MARKDOWN)
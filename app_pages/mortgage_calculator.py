@@ -0,0 +1,123 @@
+"""Mortgage Calculator page."""
+import pandas as pd
+import streamlit as st
+
+from agent_decoder.mortgage import (
+    PMI_REMOVAL_LTV,
+    RATE_REDUCTION_PER_POINT,
+    LoanOffer,
+    amortization_schedule,
+    compare_offers,
+    pmi_removal_month,
+    points_break_even,
+)
+
+
+def compare_table(offers_table, home_price, down_payment, term_years, pmi_rate):
+    """Compare the offers in the editor table; blank Points, fees and lenders count as none."""
+    offers_table = offers_table.fillna({"Points": 0.0, "Lender Fees ($)": 0.0, "Lender": ""})
+    comparison = compare_offers([
+        LoanOffer(home_price, down_payment, row["Rate (%)"], term_years, row["Points"], pmi_rate, str(row["Lender"]))
+        for _, row in offers_table.iterrows()
+    ])
+    comparison["total_cost"] += offers_table["Lender Fees ($)"].to_numpy()
+    return comparison
+
+
+def format_months(months):
+    years, months = divmod(int(months), 12)
+    return f"{years} yr {months} mo" if years else f"{months} mo"
+
+
+def render():
+    st.markdown('<h2 class="section-header">🏦 Mortgage Calculator</h2>', unsafe_allow_html=True)
+    st.write("See the full cost of a loan, when PMI comes off, and whether paying for points is worth it.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Your Loan")
+        home_price = st.number_input("Home Price ($)", min_value=10000, value=300000, step=5000)
+        down_payment_pct = st.slider("Down Payment (%)", 0.0, 50.0, 10.0, 0.5)
+        rate = st.slider("Interest Rate (%)", 1.0, 12.0, 6.5, 0.125)
+        term_years = st.selectbox("Loan Term", [30, 20, 15, 10], format_func=lambda years: f"{years} years")
+        pmi_rate = st.slider("PMI Rate (% of loan per year)", 0.0, 2.0, 0.5, 0.05)
+        points = st.slider("Discount Points", 0.0, 4.0, 0.0, 0.25)
+    
+    down_payment = home_price * down_payment_pct / 100
+    loan_amount = home_price - down_payment
+    schedule = amortization_schedule(loan_amount, rate, term_years)
+    removal = pmi_removal_month(schedule, home_price)
+    pmi_monthly = loan_amount * pmi_rate / 1200 if removal != 0 else 0.0
+    
+    with col2:
+        st.markdown("### 💡 Monthly Cost")
+        st.metric("Principal & Interest", f"${schedule.payment:,.0f}")
+        st.metric("PMI", f"${pmi_monthly:,.0f}")
+        st.metric("Total Interest Over Loan", f"${schedule.total_interest:,.0f}")
+        
+        if removal == 0:
+            st.success(f"✅ No PMI - you're putting down at least {1 - PMI_REMOVAL_LTV:.0%}")
+        elif removal is None:
+            st.error("⚠️ PMI never reaches the removal point on this schedule")
+        else:
+            st.warning(f"PMI can be removed after {format_months(removal)} (at {1 - PMI_REMOVAL_LTV:.0%} equity), "
+                       f"about ${pmi_monthly * removal:,.0f} in total")
+    
+    # Points break-even
+    st.markdown("### 🎯 Do Points Pay Off?")
+    if points:
+        cost, savings, break_even = points_break_even(loan_amount, rate, points, term_years)
+        st.write(f"**{points:g} point(s) cost:** ${cost:,.0f} upfront")
+        st.write(f"**Monthly savings:** ${savings:,.0f} (assuming {RATE_REDUCTION_PER_POINT}% off the rate per point)")
+        if break_even is None or break_even > term_years * 12:
+            st.error("⚠️ These points never pay for themselves")
+        else:
+            st.info(f"**Break-even:** {format_months(break_even)}. Only worth it if you keep the loan longer than that.")
+    else:
+        st.write("Move the **Discount Points** slider to see how long points take to pay for themselves.")
+    
+    # Balance over time
+    st.markdown("### 📉 Loan Balance Over Time")
+    balance = pd.DataFrame({
+        "Balance": schedule.balance,
+        "PMI Removal Point": home_price * PMI_REMOVAL_LTV,
+    }, index=pd.Index(schedule.month, name="Month"))
+    st.line_chart(balance)
+    with st.expander("📋 Full amortization schedule"):
+        st.dataframe(schedule.to_frame().round(2), use_container_width=True, hide_index=True)
+    
+    # Offer comparison
+    st.markdown("### ⚖️ Compare Loan Offers")
+    st.write("Enter the offers you've received. Identical loans are only calculated once, so add as many as you like.")
+    offers_table = st.data_editor(
+        pd.DataFrame({
+            "Lender": ["Agent's preferred lender", "Credit union", "Online lender"],
+            "Rate (%)": [rate, rate - 0.25, rate - 0.125],
+            "Points": [0.0, 1.0, 0.5],
+            "Lender Fees ($)": [1500.0, 800.0, 1000.0],
+        }),
+        num_rows="dynamic",
+        use_container_width=True,
+        hide_index=True,
+    ).dropna(subset=["Rate (%)"])
+    
+    if not offers_table.empty:
+        comparison = compare_table(offers_table, home_price, down_payment, term_years, pmi_rate)
+        st.dataframe(
+            comparison[["offer", "rate", "points", "monthly_payment", "pmi_months", "points_cost", "total_cost"]].rename(columns={
+                "offer": "Lender",
+                "rate": "Rate (%)",
+                "points": "Points",
+                "monthly_payment": "Monthly P&I ($)",
+                "pmi_months": "Months of PMI",
+                "points_cost": "Points Cost ($)",
+                "total_cost": "Total Cost ($)",
+            }).round(2),
+            use_container_width=True,
+            hide_index=True,
+        )
+        if comparison["total_cost"].notna().any():
+            best = comparison.loc[comparison["total_cost"].idxmin(), "offer"]
+            st.success(f"✅ Lowest total cost over the loan: **{best}**")
+        st.caption("Total cost = interest + PMI + points + lender fees over the full term.")
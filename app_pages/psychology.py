@@ -0,0 +1,48 @@
+"""Psychology page."""
+import streamlit as st
+
+from agent_decoder import data
+
+WHY_TACTICS_WORK = """\
+**Fear of Missing Out (FOMO):** Agents create artificial scarcity to trigger quick decisions
+
+**Authority Bias:** We tend to trust professionals even when they have conflicts of interest
+
+**Time Pressure:** Rushed decisions prevent us from thinking clearly or getting second opinions
+
+**Social Proof:** We assume if others are doing something, it must be right"""
+
+
+def bullets(items):
+    # "$" pairs would otherwise render as LaTeX
+    return "  \n".join(f"• '{item}'".replace("$", "\\$") for item in items)
+
+
+@st.cache_data
+def tactic_markdown(tactic, data_version):
+    """One tactic's expander body as a single Markdown/HTML string."""
+    details = data.psychology()[tactic]
+    return "\n\n".join([
+        f"**What it is:** {details['description']}",
+        f"**How it works:** {details['how_it_works']}",
+        f"**Examples:**  \n{bullets(details['examples'])}",
+        f'<div class="info-box"><strong>Psychology Behind It:</strong> {details["psychology_behind"]}</div>',
+        f'<div class="success-box"><strong>Your Defense:</strong> {details["defense"]}</div>',
+        f"**Say this instead:**  \n{bullets(details['counter_phrases'])}",
+    ])
+
+
+def render():
+    st.markdown('<h2 class="section-header">🧠 Psychology Behind Real Estate Sales</h2>', unsafe_allow_html=True)
+    psychology_database = data.psychology()
+    
+    st.write("Understanding the psychological tactics used in real estate can help you make better decisions and resist manipulation.")
+    
+    for tactic in psychology_database:
+        with st.expander(f"🎯 {tactic}"):
+            st.markdown(tactic_markdown(tactic, psychology_database.version), unsafe_allow_html=True)
+    
+    st.markdown("### 🧠 Why These Tactics Work")
+    st.markdown(WHY_TACTICS_WORK)
+    
+    st.markdown('<div class="warning-box"><strong>Remember:</strong> A good agent will encourage you to take time and ask questions. Pressure tactics are red flags.</div>', unsafe_allow_html=True)
@@ -0,0 +1,37 @@
+"""Quick Start page."""
+import streamlit as st
+
+
+def render():
+    st.markdown('<h2 class="section-header">🚀 Quick Start Guide</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🎯 What This Tool Does")
+        st.write("This decoder helps you navigate real estate transactions by:")
+        st.write("• Identifying hidden costs and fees")
+        st.write("• Recognizing manipulation tactics")
+        st.write("• Understanding agent motivations")
+        st.write("• Providing defense strategies")
+        st.write("• Preparing you for negotiations")
+        
+        st.markdown("### 🏠 Who This Helps")
+        st.write("Perfect for everyday working people:")
+        st.write("• First-time home buyers")
+        st.write("• Anyone selling their home")
+        st.write("• People feeling pressured by agents")
+        st.write("• Those who want to understand the process")
+    
+    with col2:
+        st.markdown("### ⚡ Start Here")
+        st.info("**New to real estate?** Start with 'Glossary' to understand key terms.")
+        st.warning("**Feeling pressured?** Go to 'Defense' for immediate help.")
+        st.success("**Before any meeting?** Use 'Meeting Prep Tool' to prepare.")
+        
+        st.markdown("### 🚨 Emergency Red Flags")
+        st.error("**STOP** if agent says:")
+        st.write("• 'Sign now or lose the deal'")
+        st.write("• 'Don't worry about reading that'")
+        st.write("• 'Trust me on this one'")
+        st.write("• 'Everyone else is doing it'")
@@ -0,0 +1,111 @@
+"""Realtor-Speak Decoder page."""
+import html
+
+import streamlit as st
+
+from agent_decoder import data
+from agent_decoder.core import classify_tactics, decode_phrases, transcript_analyzer
+
+TRANSCRIPT_KEY = "decoder_transcript"
+
+
+def transcript_state(text):
+    """The transcript analyzer for this session, fed only text added since the last run.
+
+    Starts over if earlier text was edited rather than appended to.
+    """
+    state = st.session_state.get(TRANSCRIPT_KEY)
+    if state is None or not text.startswith(state["text"]):
+        state = st.session_state[TRANSCRIPT_KEY] = {"analyzer": transcript_analyzer(), "text": ""}
+    if len(text) > len(state["text"]):
+        list(state["analyzer"].feed(text[len(state["text"]):]))
+        state["text"] = text
+    return state["analyzer"]
+
+
+def render_line(line):
+    speaker = f"**{line.speaker}:** " if line.speaker else ""
+    tags = " ".join(f"`{tactic}`" for tactic in line.tactics)
+    phrases = ", ".join(f"'{phrase}'" for phrase in line.phrases)
+    st.markdown(f"{line.number}. {speaker}{line.text}  \n{tags}" + (f" 🗣️ {phrases}" if phrases else ""))
+
+
+def render_transcript():
+    st.write("Paste a text or email thread with your agent, one message per line (e.g. `Agent: ...`). Add new messages at the end and only the new lines are analyzed.")
+    uploaded = st.file_uploader("Or upload a transcript (TXT)", type=["txt"])
+    transcript = uploaded.getvalue().decode("utf-8", errors="replace") if uploaded else st.text_area("Conversation:", height=250)
+    if not transcript.strip():
+        return
+    
+    analyzer = transcript_state(transcript)
+    pending = analyzer.tag(analyzer.pending, len(analyzer.lines) + 1) if analyzer.pending.strip() else None
+    counts = analyzer.tactic_counts.copy()
+    if pending is not None and not pending.quoted:
+        counts.update(pending.tactics)
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Messages", len(analyzer.lines) + (pending is not None))
+    col2.metric("Tactic Hits", sum(counts.values()))
+    col3.metric("Realtor-Speak Phrases", sum(analyzer.phrase_counts.values()) + (len(pending.phrases) if pending and not pending.quoted else 0))
+    
+    if counts:
+        st.markdown("### 🧠 Tactics Used")
+        st.bar_chart({"Lines": dict(counts.most_common())})
+    
+    tagged = [line for line in analyzer.lines if line.tactics or line.phrases]
+    if pending is not None and (pending.tactics or pending.phrases):
+        tagged.append(pending)
+    if tagged:
+        st.markdown("### 🏷️ Tagged Messages")
+        st.caption("Quoted replies (lines starting with >) are tagged but not counted twice.")
+        for line in tagged:
+            render_line(line)
+    else:
+        st.success("✅ No known pressure tactics or realtor-speak found in this conversation.")
+
+
+def render():
+    st.markdown('<h2 class="section-header">🗣️ Realtor-Speak Decoder</h2>', unsafe_allow_html=True)
+    realtor_speak = data.realtor_speak()
+    
+    mode = st.radio("Mode", ["🎯 Decode a Phrase", "🧵 Conversation Transcript"], horizontal=True)
+    if mode == "🧵 Conversation Transcript":
+        render_transcript()
+        phrase_input = ""
+    else:
+        phrase_input = st.text_area("Enter a phrase your agent said, or paste a whole email thread:")
+    
+    if phrase_input:
+        # Every known phrase in one pass over the input, then typos and paraphrases
+        decoded = decode_phrases(phrase_input)
+        for match in (d for d in decoded if d.exact):
+            st.markdown(f"### 🎯 Phrase: '{match.phrase}'")
+            st.caption(f"Found at characters {match.start}-{match.end}: \"{phrase_input[match.start:match.end]}\"")
+            st.markdown(f'<div class="warning-box"><strong>What it really means:</strong> {match.meaning}</div>', unsafe_allow_html=True)
+        
+        similar = [d for d in decoded if not d.exact]
+        if similar:
+            st.markdown("### 🔎 Sounds Like")
+            for match in similar:
+                said = html.escape(phrase_input[match.start:match.end])
+                if match.source == "realtor_speak":
+                    st.markdown(f'<div class="warning-box"><strong>"{said}"</strong> sounds like <strong>\'{match.phrase}\'</strong> ({match.score:.0%} similar): {match.meaning}</div>', unsafe_allow_html=True)
+                else:
+                    st.markdown(f'<div class="info-box"><strong>"{said}"</strong> sounds like the <strong>{match.phrase}</strong> tactic ({match.score:.0%} similar to \'{match.meaning}\')</div>', unsafe_allow_html=True)
+        
+        # Sentences the tactic classifier recognizes even without a known phrase
+        likely = classify_tactics(phrase_input)
+        if likely:
+            st.markdown("### 🧠 Likely Tactics")
+            for sentence, prediction in likely:
+                st.markdown(f'<div class="info-box"><strong>"{html.escape(sentence)}"</strong> reads like <strong>{prediction.label}</strong> ({prediction.confidence:.0%} confidence)</div>', unsafe_allow_html=True)
+        
+        if not decoded and not likely:
+            st.info("No direct match found. Try some common phrases below or describe the situation in your own words.")
+    
+    st.markdown("### 🔍 Common Phrases to Watch For")
+    for phrase, meaning in realtor_speak.items():
+        with st.expander(f"'{phrase}'"):
+            st.write(f"**Translation:** {meaning}")
+            if "pressure" in meaning.lower() or "rush" in meaning.lower():
+                st.warning("🚨 This is a pressure tactic!")
@@ -0,0 +1,120 @@
+"""Red Flag Checker page."""
+import streamlit as st
+
+from agent_decoder import data
+from agent_decoder.core import score_red_flags
+
+STATE_KEY = "red_flag_checker"
+
+RECOMMENDED_ACTIONS = """### 🛡️ Recommended Actions:
+• Document all interactions in writing with dates/times  
+• Get multiple agent opinions on any major decisions  
+• Consider switching to a different agent  
+• Consult with a real estate attorney if needed  
+• Report serious violations to your state's real estate commission  
+• Don't proceed with major decisions until issues are resolved"""
+
+
+def checker_state():
+    """Selected flags and running totals, kept across reruns."""
+    if STATE_KEY not in st.session_state:
+        st.session_state[STATE_KEY] = {"selected": set(), "total": 0, "critical": 0}
+    return st.session_state[STATE_KEY]
+
+
+def checkbox_key(flag):
+    return f"{STATE_KEY}::{flag}"
+
+
+def toggle_flag(flag, severity):
+    """Update the totals for the one flag that changed."""
+    state = checker_state()
+    checked = st.session_state[checkbox_key(flag)]
+    if checked == (flag in state["selected"]):
+        return
+    step = 1 if checked else -1
+    if checked:
+        state["selected"].add(flag)
+    else:
+        state["selected"].discard(flag)
+    state["total"] += step
+    if severity == 'Critical':
+        state["critical"] += step
+
+
+@st.cache_data
+def flag_details_html(flag, data_version):
+    """Severity box, action and legal status for one flag as a single block."""
+    details = data.red_flags()[flag]
+    if details['severity'] == 'Critical':
+        box = f'<div class="danger-box"><strong>🚨 CRITICAL:</strong> {details["why_dangerous"]}</div>'
+    elif details['severity'] == 'High':
+        box = f'<div class="warning-box"><strong>⚠️ HIGH RISK:</strong> {details["why_dangerous"]}</div>'
+    else:
+        box = f'<div class="info-box"><strong>⚡ MEDIUM RISK:</strong> {details["why_dangerous"]}</div>'
+    return (f'{box}\n\n**Immediate Action:** {details["immediate_action"]}\n\n'
+            f'**Legal Status:** {details["legal_status"]}\n\n---')
+
+
+@st.fragment
+def checklist():
+    """Checkboxes and summary; toggling a flag reruns only this panel."""
+    red_flag_database = data.red_flags()
+    state = checker_state()
+    
+    # Red flags by category, partitioned once when the data loads
+    categories = red_flag_database.by("category")
+    
+    for category, flags in categories.items():
+        st.markdown(f"### 🔍 {category} Red Flags")
+        
+        for flag, details in flags.items():
+            key = checkbox_key(flag)
+            if key not in st.session_state:
+                st.session_state[key] = flag in state["selected"]
+            if st.checkbox(flag, key=key, on_change=toggle_flag, args=(flag, details['severity'])):
+                st.markdown(flag_details_html(flag, red_flag_database.version), unsafe_allow_html=True)
+    
+    total_flagged = state["total"]
+    critical_flags = state["critical"]
+    
+    # Summary and recommendations
+    if total_flagged > 0:
+        assessment = score_red_flags(state["selected"])
+        st.metric("Risk Score", f"{assessment.score:.0f} / 100", f"{assessment.band} risk", delta_color="off")
+        
+        if assessment.band in ("Severe", "High"):
+            st.markdown(f'<div class="danger-box"><strong>🚨 {assessment.band.upper()} RISK:</strong> You\'ve identified {total_flagged} red flag(s){f", {critical_flags} of them critical" if critical_flags else ""}. Consider ending this relationship immediately and seeking legal advice.</div>', unsafe_allow_html=True)
+        elif assessment.band == "Moderate":
+            st.markdown(f'<div class="warning-box"><strong>⚠️ MODERATE RISK:</strong> You\'ve identified {total_flagged} red flag(s). This agent may not be working in your best interests. Consider switching agents.</div>', unsafe_allow_html=True)
+        else:
+            st.markdown(f'<div class="info-box"><strong>⚡ LOW RISK:</strong> You\'ve identified {total_flagged} red flag(s). Stay vigilant and document all interactions.</div>', unsafe_allow_html=True)
+        
+        st.markdown("### 📊 Why This Score\n" + "\n".join(
+            f"• **{c.label}** (+{c.points:g}): {c.explanation}  " for c in assessment.contributions
+        ))
+        
+        st.markdown(RECOMMENDED_ACTIONS)
+    else:
+        st.success("✅ No red flags detected. Continue with caution and stay informed!")
+
+
+def render():
+    st.markdown('<h2 class="section-header">🚩 Red Flag Checker</h2>', unsafe_allow_html=True)
+    st.write("Check off any behaviors you've experienced with your agent:")
+    
+    checklist()
+    
+    st.markdown("### 🚨 Emergency Red Flags")
+    emergency_flags = [
+        "Agent asks you to sign blank documents",
+        "Agent refuses to provide written agreements",
+        "Agent pressures you to lie on loan applications",
+        "Agent won't let you read contracts thoroughly",
+        "Agent demands payment upfront before services",
+        "Agent threatens you for asking questions"
+    ]
+    
+    st.markdown('<div class="danger-box"><strong>🚨 STOP IMMEDIATELY if any of these occur:</strong></div>', unsafe_allow_html=True)
+    for flag in emergency_flags:
+        st.write(f"• {flag}")
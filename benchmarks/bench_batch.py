@@ -0,0 +1,63 @@
+"""Measure batch scoring throughput as the process pool grows.
+
+Generates synthetic JSONL submissions with a fixed seed, then scores them
+in-process and with 1, 2, 4 and 8 worker processes, reporting submissions
+per second and speedup over the in-process run.
+
+    python benchmarks/bench_batch.py [--submissions N] [--workers 1 2 4 8]
+"""
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from agent_decoder import batch, data  # noqa: E402
+
+
+def synthetic_submissions(count, seed=0):
+    rng = random.Random(seed)
+    flags = list(data.red_flags())
+    lines = []
+    for number in range(count):
+        record = {
+            "id": f"S{number:07d}",
+            "red_flags": rng.sample(flags, rng.randint(0, 6)),
+            "conflicts": ["Agent represents both buyer and seller"] * rng.randint(0, 1),
+        }
+        lines.append(json.dumps(record) + "\n")
+    return "".join(lines)
+
+
+def time_run(text, workers, batch_size):
+    out = io.StringIO()
+    start = time.perf_counter()
+    count = batch.run(io.StringIO(text), out, workers=workers, batch_size=batch_size)
+    return count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=batch.BATCH_SIZE)
+    args = parser.parse_args()
+
+    text = synthetic_submissions(args.submissions)
+    print(f"{args.submissions} submissions, {len(text) / 1e6:.1f} MB, {os.cpu_count()} CPUs\n")
+    print(f"{'workers':<12}{'seconds':>10}{'per sec':>12}{'speedup':>10}")
+    count, baseline = time_run(text, 0, args.batch_size)
+    print(f"{'in-process':<12}{baseline:>10.2f}{count / baseline:>12,.0f}{1:>10.2f}")
+    for workers in args.workers:
+        count, elapsed = time_run(text, workers, args.batch_size)
+        print(f"{workers:<12}{elapsed:>10.2f}{count / elapsed:>12,.0f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure amount and fee extraction throughput.
+
+Generates synthetic contract text with a fixed seed at several densities of
+fee clauses (or reads the text file given on the command line), scans it
+with the compiled FeeExtractor and reports MB per second and amounts found.
+
+    python benchmarks/bench_fees.py [contract.txt] [--megabytes N]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from agent_decoder.core import fee_extractor  # noqa: E402
+
+WORDS = "the buyer seller agrees shall property purchase price closing date agreement party within days notice 12 2024 section 4.1".split()
+
+FEE_CLAUSES = (
+    "Transaction Fee $200–500",
+    "a commission of 3%",
+    "title insurance: $1,250.00",
+    "buyer's premium of 1.5 percent",
+    "$450 inspection",
+    "earnest money deposit of $10k",
+)
+
+LINES_PER_SEGMENT = 40
+
+
+def synthetic_segments(megabytes, fee_rate, seed=0):
+    """Segments of contract-like lines, ``fee_rate`` of them ending in a fee clause."""
+    rng = random.Random(seed)
+    lines, size = [], 0
+    while size < megabytes * 1_000_000:
+        line = " ".join(rng.choice(WORDS) for _ in range(14))
+        if rng.random() < fee_rate:
+            line += " " + rng.choice(FEE_CLAUSES)
+        line += ".\n"
+        lines.append(line)
+        size += len(line)
+    return ["".join(lines[i:i + LINES_PER_SEGMENT]) for i in range(0, len(lines), LINES_PER_SEGMENT)]
+
+
+def time_scan(segments):
+    extractor = fee_extractor()
+    start = time.perf_counter()
+    amounts = extractor.scan(segments)
+    return amounts, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("text", nargs="?", help="text file to scan instead of synthetic contracts")
+    parser.add_argument("--megabytes", type=float, default=20)
+    parser.add_argument("--fee-rates", type=float, nargs="+", default=[0.0, 0.02, 0.1, 0.5])
+    args = parser.parse_args()
+
+    fee_extractor()
+    if args.text:
+        runs = [(args.text, Path(args.text).read_text(encoding="utf-8", errors="replace").split("\n\n"))]
+    else:
+        runs = [(f"fee rate {rate:g}", synthetic_segments(args.megabytes, rate)) for rate in args.fee_rates]
+
+    print(f"{'text':<16}{'MB':>8}{'MB/s':>10}{'amounts':>10}{'per KB':>10}{'labelled':>10}")
+    for name, segments in runs:
+        megabytes = sum(map(len, segments)) / 1e6
+        amounts, elapsed = time_scan(segments)
+        labelled = sum(1 for amount in amounts if amount.label)
+        print(f"{name:<16}{megabytes:>8.1f}{megabytes / elapsed:>10.1f}{len(amounts):>10}{len(amounts) / megabytes / 1000:>10.2f}{labelled:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure page-sharded PDF analysis as the process pool grows.
+
+Builds a synthetic closing package with a fixed seed (or reads the PDF
+given on the command line), then extracts and scans it in-process and with
+1, 2, 4 and 8 worker processes, reporting pages per second and speedup over
+the in-process run.
+
+    python benchmarks/bench_pdf_pages.py [package.pdf] [--pages N] [--workers 1 2 4 8]
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pypdf import PdfWriter  # noqa: E402
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject  # noqa: E402
+
+from agent_decoder import data, parallel  # noqa: E402
+from agent_decoder.core import document_patterns  # noqa: E402
+
+WORDS = "the buyer seller agrees shall property purchase price closing date agreement party within days notice".split()
+
+LINES_PER_PAGE = 45
+
+
+def synthetic_pdf(pages, seed=0):
+    """A PDF of ``pages`` letter pages of contract-like text with planted triggers."""
+    rng = random.Random(seed)
+    triggers = [t for details in data.red_flags().values() for t in details.get("document_triggers", ())]
+    triggers += list(data.glossary()) + list(data.realtor_speak())
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for _ in range(pages):
+        lines = []
+        for _ in range(LINES_PER_PAGE):
+            words = [rng.choice(WORDS) for _ in range(12)]
+            if rng.random() < 0.2:
+                words.insert(5, rng.choice(triggers))
+            text = " ".join(words).replace("\\", "").replace("(", "").replace(")", "")
+            lines.append(f"({text}) '")
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 10 Tf 40 760 Td 16 TL {' '.join(lines)} ET".encode("latin-1", "replace"))
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+        page[NameObject("/Contents")] = writer._add_object(content)
+    out = io.BytesIO()
+    writer.write(out)
+    out.seek(0)
+    return out
+
+
+def time_run(pdf, workers, pages_per_shard):
+    start = time.perf_counter()
+    report = parallel.analyze_pdf(pdf, workers=workers, pages_per_shard=pages_per_shard)
+    return report.segments, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf", nargs="?", help="PDF to analyze instead of a synthetic one")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--pages-per-shard", type=int, default=parallel.PAGES_PER_SHARD)
+    args = parser.parse_args()
+
+    pdf = io.BytesIO(Path(args.pdf).read_bytes()) if args.pdf else synthetic_pdf(args.pages)
+    document_patterns()
+    print(f"{len(pdf.getbuffer()) / 1e6:.1f} MB PDF, {args.pages_per_shard} pages per shard, {os.cpu_count()} CPUs\n")
+    print(f"{'workers':<12}{'seconds':>10}{'pages/s':>10}{'speedup':>10}")
+    pages, baseline = time_run(pdf, 0, args.pages_per_shard)
+    print(f"{'in-process':<12}{baseline:>10.2f}{pages / baseline:>10.0f}{1:>10.2f}")
+    for workers in args.workers:
+        pages, elapsed = time_run(pdf, workers, args.pages_per_shard)
+        print(f"{workers:<12}{elapsed:>10.2f}{pages / elapsed:>10.0f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure per-interaction script time and element deltas for every tool.
+
+Runs the app headlessly with Streamlit's AppTest, selects each sidebar tool
+and reruns it several times, reporting the mean script execution time, the
+number of elements (delta messages) the run sends to the browser and the
+serialized size of those elements, a close proxy for websocket payload.
+
+    python benchmarks/bench_rerun.py [path/to/app.py] [--runs N]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def count_deltas(node):
+    """Count every element and container block below ``node``."""
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return 1 + sum(count_deltas(child) for child in children.values())
+
+
+def payload_bytes(node):
+    """Serialized protobuf size of every element and block below ``node``."""
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None else 0
+    children = getattr(node, "children", None) or {}
+    return size + sum(payload_bytes(child) for child in children.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("app", nargs="?", default=str(ROOT / "app.py"))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, str(ROOT))
+
+    at = AppTest.from_file(args.app, default_timeout=60).run()
+    if at.exception:
+        print(f"App raised on first run: {at.exception[0].message.splitlines()[0]}")
+    tools = at.sidebar.selectbox[0].options
+
+    print(f"{'tool':<28}{'mean ms':>10}{'deltas':>10}{'bytes':>10}")
+    total_ms, total_deltas, total_bytes = 0.0, 0, 0
+    for tool in tools:
+        at.sidebar.selectbox[0].select(tool).run()
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            at.run()
+            timings.append((time.perf_counter() - start) * 1000)
+        mean_ms = statistics.mean(timings)
+        deltas = count_deltas(at._tree)
+        size = payload_bytes(at._tree)
+        total_ms += mean_ms
+        total_deltas += deltas
+        total_bytes += size
+        print(f"{tool:<28}{mean_ms:>10.1f}{deltas:>10}{size:>10}")
+    print(f"{'total':<28}{total_ms:>10.1f}{total_deltas:>10}{total_bytes:>10}")
+
+
+if __name__ == "__main__":
+    main()
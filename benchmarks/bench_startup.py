@@ -0,0 +1,65 @@
+"""Measure app cold-start time and the import cost of each page module.
+
+Every measurement runs in a fresh interpreter so nothing is already cached
+in ``sys.modules``. Page import cost is measured on top of an interpreter
+that has already imported Streamlit, since every page shares that cost.
+
+    python benchmarks/bench_startup.py [--repeat N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app_pages import __path__ as PAGES_PATH  # noqa: E402
+
+COLD_START = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120).run()
+assert not at.exception, at.exception
+print((time.perf_counter() - start) * 1000)
+"""
+
+PAGE_IMPORT = """
+import importlib, time
+import streamlit
+start = time.perf_counter()
+importlib.import_module({module!r})
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def run_ms(code, repeat):
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cold = run_ms(COLD_START.format(app=str(ROOT / "app.py")), args.repeat)
+    print(f"Cold start (first script run, incl. Streamlit import): {cold:.0f} ms\n")
+
+    print(f"{'page module':<40}{'import ms':>10}")
+    modules = sorted(
+        f"app_pages.{path.stem}" for path in Path(PAGES_PATH[0]).glob("*.py") if path.stem != "__init__"
+    )
+    for module in modules:
+        print(f"{module:<40}{run_ms(PAGE_IMPORT.format(module=module), args.repeat):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
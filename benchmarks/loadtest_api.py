@@ -0,0 +1,137 @@
+"""Load-test the decoder JSON API over keep-alive connections.
+
+Opens ``--connections`` persistent HTTP/1.1 connections and sends decode
+requests (a mix of exact, misspelled and unrelated sentences) back to back
+on each for ``--seconds``, then reports requests per second and latency
+percentiles. With ``--serve`` it starts uvicorn on a free port first.
+
+    python benchmarks/loadtest_api.py --serve --workers 4 --connections 64
+    python benchmarks/loadtest_api.py --url http://127.0.0.1:8000 --path /score
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from agent_decoder import data  # noqa: E402
+
+FILLER = [
+    "Let me know when you are free to tour the place.",
+    "The inspection is scheduled for Tuesday morning.",
+    "I sent the disclosures over this afternoon.",
+]
+
+
+def request_bodies(path, count=500, seed=0):
+    rng = random.Random(seed)
+    phrases = list(data.realtor_speak())
+    flags = list(data.red_flags())
+    bodies = []
+    for _ in range(count):
+        if path == "/score":
+            payload = {"red_flags": rng.sample(flags, rng.randint(0, 5))}
+        else:
+            phrase = rng.choice(phrases)
+            if rng.random() < 0.5:
+                i = rng.randrange(len(phrase))
+                phrase = phrase[:i] + phrase[i + 1:]
+            payload = {"text": f"{rng.choice(FILLER)} {phrase}. {rng.choice(FILLER)}"}
+        bodies.append(json.dumps(payload).encode())
+    return bodies
+
+
+async def connection(host, port, path, bodies, deadline, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    i = 0
+    while time.perf_counter() < deadline:
+        body = bodies[i % len(bodies)]
+        i += 1
+        start = time.perf_counter()
+        writer.write(
+            f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        status = await reader.readline()
+        length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+        if b" 200 " not in status:
+            raise RuntimeError(f"unexpected response: {status!r}")
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def load(host, port, path, connections, seconds):
+    bodies = request_bodies(path)
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    await asyncio.gather(*(connection(host, port, path, bodies, deadline, latencies) for _ in range(connections)))
+    return latencies, time.perf_counter() - started
+
+
+def serve(workers):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "agent_decoder.asgi", "--port", str(port), "--workers", str(workers)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    for _ in range(200):
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1).read()
+            return server, port
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/decode", choices=["/decode", "/score"])
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--serve", action="store_true", help="start uvicorn on a free port for the test")
+    parser.add_argument("--workers", type=int, default=1, help="server processes with --serve")
+    args = parser.parse_args()
+
+    server = None
+    if args.serve:
+        server, port = serve(args.workers)
+        host = "127.0.0.1"
+    else:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    try:
+        latencies, elapsed = asyncio.run(load(host, port, args.path, args.connections, args.seconds))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    print(f"{args.path}: {len(ms)} requests over {args.connections} keep-alive connections in {elapsed:.1f} s")
+    print(f"  {len(ms) / elapsed:,.0f} req/s")
+    print(f"  latency p50 {statistics.median(ms):.2f} ms, p95 {ms[int(len(ms) * 0.95)]:.2f} ms, p99 {ms[int(len(ms) * 0.99)]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import io
+
+from agent_decoder.core import document_patterns, fee_extractor
+from agent_decoder.documents import MAX_SEGMENT_CHARS, analyze_document
+
+
+def analyze(text):
+    upload = io.BytesIO(text.encode())
+    return analyze_document(upload, document_patterns(), "contract.txt", keep_text=True, fees=fee_extractor())
+
+
+def test_amount_across_a_window_cut_is_kept_whole():
+    # No line breaks, so the run is cut into windows at MAX_SEGMENT_CHARS.
+    filler = "word " * ((MAX_SEGMENT_CHARS - 20) // 5)
+    text = filler + "transaction fee of $1,250,000 due " + filler
+    report = analyze(text)
+    assert report.segments > 1
+    [amount] = report.amounts
+    assert amount.matched == "$1,250,000"
+    assert text[amount.offset:amount.offset + len(amount.matched)] == "$1,250,000"
+    assert amount.label == "transaction fee"
@@ -0,0 +1,17 @@
+from agent_decoder.core import extract_amounts
+
+
+def labels(text):
+    return [(amount.matched, amount.label) for amount in extract_amounts([text])]
+
+
+def test_percent_label_does_not_carry_to_price():
+    assert labels("a 3% commission on the $400,000 price") == [("3%", "commission"), ("$400,000", "")]
+
+
+def test_percent_fee_does_not_label_sale_price():
+    assert labels("the 6% fee on a $500,000 sale") == [("6%", "fee"), ("$500,000", "")]
+
+
+def test_plural_fee_word_is_a_label():
+    assert labels("Costs of $5 - $10") == [("$5 - $10", "Costs")]
@@ -0,0 +1,22 @@
+import pytest
+
+from agent_decoder.core import decode_phrases
+from agent_decoder.fuzzy import normalize
+
+
+@pytest.mark.parametrize("bare, spelled", [
+    ("wont", "won't"),
+    ("dont", "don't"),
+    ("cant", "can't"),
+    ("youre", "you're"),
+    ("theyre", "they're"),
+    ("isnt", "isn't"),
+])
+def test_contractions_without_apostrophe(bare, spelled):
+    assert normalize(f"it {bare} go") == normalize(f"it {spelled} go")
+
+
+def test_phrase_matches_without_apostrophe():
+    [spelled] = decode_phrases("this one won't last")
+    [bare] = decode_phrases("this one wont last")
+    assert (bare.phrase, bare.score) == (spelled.phrase, spelled.score)
@@ -0,0 +1,19 @@
+import math
+
+import pandas as pd
+
+from app_pages.mortgage_calculator import compare_table
+
+
+def test_blank_points_count_as_none():
+    offers = pd.DataFrame({
+        "Lender": ["Credit union", None],
+        "Rate (%)": [6.5, 6.5],
+        "Points": [0.0, float("nan")],
+        "Lender Fees ($)": [800.0, float("nan")],
+    })
+    comparison = compare_table(offers, 400_000, 80_000, 30, 0.5)
+    assert comparison["points_cost"].tolist() == [0.0, 0.0]
+    assert not comparison["total_cost"].isna().any()
+    assert math.isclose(comparison["total_cost"][0] - comparison["total_cost"][1], 800.0)
+    assert comparison["offer"][1] == "Offer 2"